@@ -30,8 +30,10 @@ import argparse
 import logging
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add project root to path (once, so re-imports don't grow sys.path)
+_PROJECT_ROOT = str(Path(__file__).resolve().parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from cli_utils import CommonCLI
 from config import Config, ConfigurationError
@@ -305,7 +307,8 @@ def cmd_scan_empty_wrappers(args):
 
     try:
         stats = scan_wrappers_main(directory=directory, output_csv=output_csv, recursive=args.recursive,
-                                   min_nesting_depth=args.min_depth, min_wrapper_count=args.min_count)
+                                   min_nesting_depth=args.min_depth, min_wrapper_count=args.min_count,
+                                   max_workers=args.workers)
         msg = "✅ Scan completed!" if stats['total_empty_wrappers'] > 0 else "No empty list wrappers found"
         print(f"\n{'=' * 80}\n{msg}\n{'=' * 80}\nFiles scanned:        {stats['files_scanned']}\n"
               f"Files with wrappers:  {stats['files_with_wrappers']}\nWrapper chains:       {stats['total_wrapper_chains']}\n"
@@ -480,15 +483,23 @@ def cmd_organize_categories(args):
         logger.error("Database ID is required (use --database-id or set NOTION_DATABASE_ID in .env)")
         return 1
 
-    logger.info(f"CSV file: {args.csv}\nDatabase ID: {database_id}\nDry run: {args.dry_run}")
+    if args.existing_mapping and not Path(args.existing_mapping).exists():
+        logger.error(f"Mapping file not found: {args.existing_mapping}")
+        return 1
+
+    logger.info(f"CSV file: {args.csv}\nDatabase ID: {database_id}\nDry run: {args.dry_run}\n"
+                f"Workers: {args.workers}\nRate limit: {args.rate_limit}s")
     if args.dry_run:
         print("\n[DRY RUN] Previewing category organization...")
 
     result = build_categories_from_csv(api_key=Config.NOTION_API_KEY, database_id=database_id,
-                                      csv_path=str(csv_path), dry_run=args.dry_run)
+                                      csv_path=str(csv_path), dry_run=args.dry_run,
+                                      max_workers=args.workers, rate_limit_delay=args.rate_limit,
+                                      existing_mapping=args.existing_mapping)
 
     print_separator("Results", "-")
     print(f"Success: {'✅ Yes' if result['success'] else '❌ No'}\nCategories created: {result['categories_created']}\n"
+          f"Categories reused: {result['categories_reused']}\n"
           f"Relationships created: {result['relationships_created']}\nErrors: {len(result['errors'])}")
 
     if result['errors']:
@@ -762,6 +773,12 @@ def main():
         metavar='N',
         help='Minimum empty wrappers per file to report (default: 3)'
     )
+    wrappers_parser.add_argument(
+        '--workers',
+        type=int,
+        metavar='N',
+        help='Number of worker processes (default: CPU count)'
+    )
     wrappers_parser.set_defaults(func=cmd_scan_empty_wrappers, recursive=True)
 
     # =================================================================
@@ -925,11 +942,30 @@ def main():
         metavar='PATH',
         help='Export category path to page ID mapping as CSV'
     )
+    organize_parser.add_argument(
+        '--existing-mapping',
+        metavar='PATH',
+        help='Category mapping CSV from a previous run; listed categories reuse their page'
+    )
     organize_parser.add_argument(
         '--dry-run',
         action='store_true',
         help='Preview without creating pages'
     )
+    organize_parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        metavar='N',
+        help='Number of category pages created concurrently (default: 4, use 1 for sequential)'
+    )
+    organize_parser.add_argument(
+        '--rate-limit',
+        type=float,
+        default=0.1,
+        metavar='SECONDS',
+        help='Minimum delay between Notion API requests across all workers (default: 0.1)'
+    )
     organize_parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -9,13 +9,37 @@ Results are reported in CSV format.
 """
 import logging
 import csv
-from pathlib import Path
-from typing import List, Dict, Tuple
-from bs4 import BeautifulSoup, Tag
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Union
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 
 logger = logging.getLogger(__name__)
 
+# A wrapper chain needs an <li> holding a nested <ul>/<ol>; files without both
+# tags cannot match, so they are skipped before parsing
+_LI_TAG_RE = re.compile(rb'<li[\s>/]', re.IGNORECASE)
+_LIST_TAG_RE = re.compile(rb'<[ou]l[\s>/]', re.IGNORECASE)
+
+# Source files are UTF-8; passing bytes lets libxml2 skip any XML declaration
+# instead of rejecting it, as it does for str input
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# Marker set on chain members in the parsed tree so later <li>s can be skipped
+_SCANNED_ATTR = 'data-wrapper-scanned'
+
+# Per-<li> state kept on the node while streaming (document order, chain length)
+_ORDER_ATTR = 'data-wrapper-order'
+_CHAIN_ATTR = 'data-wrapper-chain'
+
+# Set on a <ul>/<ol> when its first <li> closes ("order,chain"), so the
+# list's items can be discarded while streaming
+_FIRST_LI_ATTR = 'data-wrapper-first-li'
 
 class EmptyListWrapperScanner:
     """
@@ -29,16 +53,39 @@ class EmptyListWrapperScanner:
     These structures render as excessive blank lines in Notion, harming usability.
     """
 
-    def __init__(self, min_nesting_depth: int = 2, min_wrapper_count: int = 3):
+    # Inline style that hides the list marker
+    NO_MARKER_STYLE_RE = re.compile(r'list-style-type\s*:\s*none', re.IGNORECASE)
+
+    CSV_FIELDNAMES = ['file', 'line_number', 'nesting_depth', 'wrapper_count', 'parent_path']
+
+    # libxml2's HTML parser stores source lines in 16 bits and saturates here
+    MAX_SOURCELINE = 65535
+
+    # Chain descent lookups, evaluated by libxml2
+    FIRST_CHILD_LIST_XPATH = etree.XPath('./*[self::ul or self::ol][1]')
+    FIRST_CHILD_LI_XPATH = etree.XPath('./li[1]')
+
+    def __init__(
+        self,
+        min_nesting_depth: int = 2,
+        min_wrapper_count: int = 3,
+        prefilter: bool = True,
+        stream_threshold_bytes: Optional[int] = 100 * 1024 * 1024
+    ):
         """
         Initialize scanner.
 
         Args:
             min_nesting_depth: Minimum nesting depth to report (default: 2)
             min_wrapper_count: Minimum empty wrappers to report file (default: 3)
+            prefilter: Skip parsing files whose bytes contain no <li> or no <ul>/<ol> (default: True)
+            stream_threshold_bytes: Files larger than this are scanned with
+                                    scan_html_stream (default: 100 MB, None = never)
         """
         self.min_nesting_depth = min_nesting_depth
         self.min_wrapper_count = min_wrapper_count
+        self.prefilter = prefilter
+        self.stream_threshold_bytes = stream_threshold_bytes
         self.stats = {
             "files_scanned": 0,
             "files_with_wrappers": 0,
@@ -46,9 +93,19 @@ class EmptyListWrapperScanner:
             "total_empty_wrappers": 0
         }
         self.results = []
+        # Report being streamed by process_directory; opened on its first row
+        self._csv_path: Optional[Path] = None
+        self._csv_file = None
+        self._csv_writer: Optional[csv.DictWriter] = None
+        self._path_cache: Dict[HtmlElement, str] = {}  # Parent element -> ancestor path, per scan
+        # Source of the current scan_html call, for lines past MAX_SOURCELINE
+        self._source: Optional[bytes] = None
+        self._source_root: Optional[HtmlElement] = None
+        self._li_offsets: Optional[List[int]] = None  # Byte offset of each <li> tag
+        self._line_cursor: Tuple[int, int] = (0, 1)  # Last recovered (offset, line)
         logger.info(f"EmptyListWrapperScanner initialized (min_depth={min_nesting_depth}, min_count={min_wrapper_count})")
 
-    def is_empty_wrapper_li(self, li_element: Tag) -> bool:
+    def is_empty_wrapper_li(self, li_element: HtmlElement) -> bool:
         """
         Check if an <li> element is an empty wrapper.
 
@@ -58,35 +115,28 @@ class EmptyListWrapperScanner:
         - Has no meaningful text content
 
         Args:
-            li_element: BeautifulSoup Tag for <li> element
+            li_element: lxml element for <li>
 
         Returns:
             True if this is an empty wrapper element
         """
-        # Check if it has list-style-type: none
-        style = li_element.get('style', '')
-        has_no_marker = 'list-style-type' in style and 'none' in style
-
-        # Get direct children (excluding whitespace text nodes)
-        children = [child for child in li_element.children if child.name]
-
-        # Check if it only contains a single ul/ol
-        if len(children) == 1 and children[0].name in ['ul', 'ol']:
-            # Check if there's any meaningful text directly in this li (not in children)
-            direct_text = ''.join([str(c) for c in li_element.children if not hasattr(c, 'name')]).strip()
-            if not direct_text:
-                return True
-
-        # Also check if it's an empty li with only nested lists
-        if has_no_marker and len(children) <= 1:
-            text_content = li_element.get_text(strip=True)
-            # If the li has very little direct text and contains lists, it's likely a wrapper
-            if children and children[0].name in ['ul', 'ol']:
-                return True
-
-        return False
-
-    def find_wrapper_chain(self, li_element: Tag) -> Tuple[int, List[Tag]]:
+        # Both wrapper forms have exactly one element child, and it is a ul/ol
+        # (iterchildren(Element) skips text, comments and processing instructions in C)
+        children = list(li_element.iterchildren(etree.Element))
+        if len(children) != 1 or children[0].tag not in ('ul', 'ol'):
+            return False
+
+        # An explicit list-style-type: none marks a wrapper regardless of text
+        if self.NO_MARKER_STYLE_RE.search(li_element.get('style', '')):
+            return True
+
+        # Otherwise there must be no meaningful text directly in this li (not in children);
+        # stop at the first non-whitespace piece instead of joining them all
+        if li_element.text and li_element.text.strip():
+            return False
+        return not any(child.tail and child.tail.strip() for child in li_element)
+
+    def find_wrapper_chain(self, li_element: HtmlElement) -> Tuple[int, List[HtmlElement]]:
         """
         Find the chain of empty wrapper <li> elements.
 
@@ -102,110 +152,157 @@ class EmptyListWrapperScanner:
         chain = []
         current = li_element
 
-        while current and current.name == 'li':
+        while current is not None and current.tag == 'li':
             if not self.is_empty_wrapper_li(current):
                 break
 
             chain.append(current)
 
             # Find the child ul/ol
-            child_list = None
-            for child in current.children:
-                if hasattr(child, 'name') and child.name in ['ul', 'ol']:
-                    child_list = child
-                    break
-
-            if not child_list:
+            child_lists = self.FIRST_CHILD_LIST_XPATH(current)
+            if not child_lists:
                 break
 
             # Find the child li within the ul/ol
-            child_li = None
-            for child in child_list.children:
-                if hasattr(child, 'name') and child.name == 'li':
-                    child_li = child
-                    break
-
-            if not child_li:
+            child_lis = self.FIRST_CHILD_LI_XPATH(child_lists[0])
+            if not child_lis:
                 break
 
-            current = child_li
+            current = child_lis[0]
 
         return (len(chain), chain)
 
-    def get_line_number(self, element: Tag, html_content: str) -> int:
+    def get_line_number(self, element: HtmlElement, li_index: Optional[int] = None) -> Optional[int]:
         """
-        Estimate the line number of an element in the HTML.
+        Get the source line number of an element.
+
+        libxml2 records the line while parsing, so no search through the HTML
+        is needed. Its HTML parser saturates at line 65535; past that, the line
+        of an <li> is recovered from the raw source by its position among the
+        document's <li> tags.
 
         Args:
-            element: BeautifulSoup Tag element
-            html_content: Original HTML content
+            element: lxml element
+            li_index: Position of the element among the <li> elements of the
+                      document being scanned, used to recover lines past 65535
 
         Returns:
-            Approximate line number (1-indexed)
+            Line number (1-indexed), or None if unknown
         """
-        try:
-            # Get a unique string from the element
-            element_str = str(element)[:100]
-            # Find position in HTML
-            pos = html_content.find(element_str[:50])
-            if pos >= 0:
-                # Count newlines up to this position
-                return html_content[:pos].count('\n') + 1
-        except Exception:
-            pass
-        return 0
-
-    def get_element_path(self, element: Tag) -> str:
+        line = element.sourceline or None
+        if line is not None and line >= self.MAX_SOURCELINE:
+            line = self._recover_li_line(li_index) if li_index is not None else None
+        return line
+
+    def _recover_li_line(self, li_index: int) -> Optional[int]:
+        """
+        Find the line of the li_index-th <li> tag in the source being scanned.
+
+        Tag offsets are collected once per file. Chains are visited in document
+        order, so newlines are counted forward from the last recovered line.
+
+        Args:
+            li_index: Position of the <li> among the document's <li> elements
+
+        Returns:
+            Line number (1-indexed), or None if it cannot be determined
+        """
+        if self._source is None:
+            return None
+
+        if self._li_offsets is None:
+            offsets = [match.start() for match in _LI_TAG_RE.finditer(self._source)]
+            # A stray "<li" in a comment or script would shift every later position
+            li_count = sum(1 for _ in self._source_root.iter('li'))
+            self._li_offsets = offsets if len(offsets) == li_count else []
+
+        if li_index >= len(self._li_offsets):
+            return None
+
+        offset = self._li_offsets[li_index]
+        last_offset, last_line = self._line_cursor
+        if offset < last_offset:
+            last_offset, last_line = 0, 1
+
+        line = last_line + self._source.count(b'\n', last_offset, offset)
+        self._line_cursor = (offset, line)
+        return line
+
+    @staticmethod
+    def _path_part(element: HtmlElement) -> str:
+        """Format one path segment as tag, tag#id or tag.first-class."""
+        element_id = element.get('id')
+        if element_id:
+            return f"{element.tag}#{element_id}"
+        classes = (element.get('class') or '').split()
+        if classes:
+            return f"{element.tag}.{classes[0]}"
+        return element.tag
+
+    def get_element_path(self, element: HtmlElement) -> str:
         """
         Get a CSS selector-like path to the element.
 
+        The path covers the element and up to 4 ancestors. The ancestor part is
+        cached per parent element, so sibling chains reuse it.
+
         Args:
-            element: BeautifulSoup Tag element
+            element: lxml element
 
         Returns:
             Path string
         """
-        path_parts = []
-        current = element
-
-        depth = 0
-        while current and current.name and depth < 5:
-            part = current.name
-            if current.get('id'):
-                part += f"#{current.get('id')}"
-            elif current.get('class'):
-                classes = current.get('class')
-                if isinstance(classes, list) and classes:
-                    part += f".{classes[0]}"
-            path_parts.insert(0, part)
-            current = current.parent
-            depth += 1
-
-        return ' > '.join(path_parts)
-
-    def scan_html(self, html_content: str, file_path: Path) -> List[Dict[str, any]]:
+        part = self._path_part(element)
+        parent = element.getparent()
+        if parent is None:
+            return part
+
+        prefix = self._path_cache.get(parent)
+        if prefix is None:
+            parts = []
+            current = parent
+            while current is not None and len(parts) < 4:
+                parts.append(self._path_part(current))
+                current = current.getparent()
+            parts.reverse()
+            prefix = ' > '.join(parts)
+            # Keyed by the element itself: lxml proxies can be recycled, so id() is unsafe
+            self._path_cache[parent] = prefix
+
+        return f"{prefix} > {part}"
+
+    def scan_html(self, html_content: Union[str, bytes], file_path: Path) -> List[Dict[str, any]]:
         """
         Scan HTML content for empty list wrapper chains.
 
         Args:
-            html_content: HTML string to scan
+            html_content: HTML to scan, as a string or UTF-8 bytes
             file_path: Path to the HTML file (for reporting)
 
         Returns:
             List of dictionaries with wrapper chain information
         """
         wrapper_chains = []
-        processed_elements = set()  # Avoid double-counting
+        self._path_cache = {}
 
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+        if not html_content.strip():
+            return wrapper_chains
 
-            # Find all <li> elements
-            all_li_elements = soup.find_all('li')
+        # lxml rejects str input that carries an encoding declaration
+        if isinstance(html_content, str):
+            html_content = html_content.encode('utf-8')
 
-            for li_element in all_li_elements:
+        try:
+            # lxml's libxml2-backed parser is far faster than html.parser
+            root = lxml.html.fromstring(html_content, parser=_HTML_PARSER)
+            self._source = html_content
+            self._source_root = root
+            self._li_offsets = None
+            self._line_cursor = (0, 1)
+
+            for li_index, li_element in enumerate(root.iter('li')):
                 # Skip if already processed as part of a chain
-                if id(li_element) in processed_elements:
+                if li_element.get(_SCANNED_ATTR) is not None:
                     continue
 
                 # Check if this is the start of an empty wrapper chain
@@ -214,11 +311,12 @@ class EmptyListWrapperScanner:
 
                     # Only report if it meets threshold
                     if depth >= self.min_nesting_depth:
-                        # Mark all elements in chain as processed
+                        # Mark all elements in chain as processed (stored on the
+                        # libxml2 node, since lxml proxies do not keep Python state)
                         for elem in chain:
-                            processed_elements.add(id(elem))
+                            elem.set(_SCANNED_ATTR, '')
 
-                        line_number = self.get_line_number(li_element, html_content)
+                        line_number = self.get_line_number(li_element, li_index)
 
                         wrapper_chains.append({
                             'file': str(file_path),
@@ -234,57 +332,252 @@ class EmptyListWrapperScanner:
             logger.error(f"Error scanning HTML in {file_path}: {e}")
             return []
 
-    def process_file(self, file_path: Path) -> List[Dict[str, any]]:
+        finally:
+            # Do not keep the file's bytes alive between scans
+            self._source = None
+            self._source_root = None
+            self._li_offsets = None
+
+    def scan_html_stream(self, file_path: Path) -> List[Dict[str, any]]:
         """
-        Process a single HTML file.
+        Scan a large HTML file with iterparse, discarding each element once it is processed.
+
+        Chains are resolved bottom-up: when an <li> closes, its chain length is
+        one more than that of the <li> it wraps, and the wrapped <li>'s own row
+        is dropped since it belongs to the longer chain. Rows match scan_html,
+        except line_number is blank: libxml2's incremental HTML parser does not
+        record source lines.
 
         Args:
-            file_path: Path to HTML file
+            file_path: Path to the HTML file
 
         Returns:
-            List of wrapper chains found
+            List of dictionaries with wrapper chain information
         """
-        logger.info(f"Processing file: {file_path}")
-        self.stats["files_scanned"] += 1
+        candidates = {}  # document order of chain head -> row
+        self._path_cache = {}
+        order = 0
 
         try:
-            # Read HTML file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            events = etree.iterparse(
+                str(file_path),
+                events=('start', 'end'),
+                html=True,
+                encoding='utf-8'
+            )
+
+            for event, element in events:
+                if event == 'start':
+                    if element.tag == 'li':
+                        element.set(_ORDER_ATTR, str(order))
+                        order += 1
+                    continue
 
-            # Scan for empty wrapper chains
-            wrapper_chains = self.scan_html(html_content, file_path)
+                if element.tag == 'li':
+                    self._close_stream_li(element, file_path, candidates)
 
-            if wrapper_chains:
-                total_wrappers = sum(chain['wrapper_count'] for chain in wrapper_chains)
+                self._discard_streamed(element)
 
-                # Only report if total wrappers meet threshold
-                if total_wrappers >= self.min_wrapper_count:
-                    logger.info(f"Found {len(wrapper_chains)} wrapper chain(s) with {total_wrappers} total empty wrappers in {file_path.name}")
-                    self.stats["files_with_wrappers"] += 1
-                    self.stats["total_wrapper_chains"] += len(wrapper_chains)
-                    self.stats["total_empty_wrappers"] += total_wrappers
-                    self.results.extend(wrapper_chains)
-                    return wrapper_chains
-            else:
-                logger.debug(f"No empty wrapper chains found in {file_path.name}")
+            return [candidates[key] for key in sorted(candidates)]
 
+        except Exception as e:
+            logger.error(f"Error scanning HTML in {file_path}: {e}")
             return []
 
+    def _close_stream_li(
+        self,
+        li_element: HtmlElement,
+        file_path: Path,
+        candidates: Dict[int, Dict[str, any]]
+    ) -> None:
+        """
+        Resolve the chain ending at a closed <li> while streaming.
+
+        Args:
+            li_element: <li> whose end tag was just parsed
+            file_path: Path to the HTML file (for reporting)
+            candidates: Rows keyed by chain head document order, updated in place
+        """
+        order = li_element.get(_ORDER_ATTR)
+
+        depth = 0
+        if self.is_empty_wrapper_li(li_element):
+            depth = 1
+            # The wrapped list recorded its first <li> when that item closed
+            # (looked up by element, since comments may precede the list)
+            first_li = self.FIRST_CHILD_LIST_XPATH(li_element)[0].get(_FIRST_LI_ATTR)
+            if first_li:
+                child_order, child_depth = first_li.split(',')
+                depth += int(child_depth)
+                # The wrapped <li> is part of this chain, not a chain head
+                candidates.pop(int(child_order), None)
+
+        if depth >= self.min_nesting_depth:
+            candidates[int(order)] = {
+                'file': str(file_path),
+                'line_number': self.get_line_number(li_element),
+                'nesting_depth': depth,
+                'wrapper_count': depth,
+                'parent_path': self.get_element_path(li_element)
+            }
+
+        parent = li_element.getparent()
+        if parent is not None and parent.tag in ('ul', 'ol') and parent.get(_FIRST_LI_ATTR) is None:
+            parent.set(_FIRST_LI_ATTR, f"{order},{depth}")
+
+    @staticmethod
+    def _discard_streamed(element: HtmlElement) -> None:
+        """
+        Drop a closed element's content, and its processed siblings, from the streamed tree.
+
+        Children of an open <li> stay attached (emptied) until the <li> itself
+        closes, since is_empty_wrapper_li inspects them and their tails.
+
+        Args:
+            element: Element whose end tag was just parsed
+        """
+        parent = element.getparent()
+
+        if parent is not None and parent.tag == 'li':
+            # Keep the element, its attributes and tail for the enclosing <li>
+            del element[:]
+            return
+
+        element.clear()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+    @staticmethod
+    def may_contain_wrappers(html_bytes: bytes) -> bool:
+        """
+        Cheap byte-level check run before the HTML parser.
+
+        Args:
+            html_bytes: Raw file content (bytes or an mmap)
+
+        Returns:
+            False only if the content cannot contain a wrapper chain
+        """
+        return bool(_LI_TAG_RE.search(html_bytes) and _LIST_TAG_RE.search(html_bytes))
+
+    def scan_file(self, file_path: Path) -> List[Dict[str, any]]:
+        """
+        Read and scan a single HTML file without updating stats.
+
+        Args:
+            file_path: Path to HTML file
+
+        Returns:
+            List of wrapper chains found (before the per-file threshold)
+        """
+        try:
+            # Very large files are streamed instead of built into a full tree
+            if (self.stream_threshold_bytes is not None
+                    and file_path.stat().st_size > self.stream_threshold_bytes):
+                return self.scan_html_stream(file_path)
+
+            with open(file_path, 'rb') as f:
+                # mmap cannot map an empty file
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+
+                # Prefilter on the mapped pages so skipped files are never copied
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if self.prefilter and not self.may_contain_wrappers(mm):
+                        logger.debug(f"No list markup in {file_path.name}, skipping parse")
+                        return []
+                    html_content = bytes(mm)
+
+            # Scan for empty wrapper chains
+            return self.scan_html(html_content, file_path)
+
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {e}")
             return []
 
-    def process_directory(self, directory: Path, recursive: bool = False) -> List[Dict[str, any]]:
+    def record_file_result(self, file_path: Path, wrapper_chains: List[Dict[str, any]]) -> List[Dict[str, any]]:
+        """
+        Apply the per-file threshold to scanned chains and update stats/results.
+
+        Args:
+            file_path: Path to the scanned HTML file
+            wrapper_chains: Chains returned by scan_file
+
+        Returns:
+            List of wrapper chains reported for this file
+        """
+        self.stats["files_scanned"] += 1
+
+        if wrapper_chains:
+            total_wrappers = sum(chain['wrapper_count'] for chain in wrapper_chains)
+
+            # Only report if total wrappers meet threshold
+            if total_wrappers >= self.min_wrapper_count:
+                logger.info(f"Found {len(wrapper_chains)} wrapper chain(s) with {total_wrappers} total empty wrappers in {file_path.name}")
+                self.stats["files_with_wrappers"] += 1
+                self.stats["total_wrapper_chains"] += len(wrapper_chains)
+                self.stats["total_empty_wrappers"] += total_wrappers
+                if self._csv_path is not None:
+                    self._report_writer().writerows(wrapper_chains)
+                else:
+                    self.results.extend(wrapper_chains)
+                return wrapper_chains
+        else:
+            logger.debug(f"No empty wrapper chains found in {file_path.name}")
+
+        return []
+
+    def _report_writer(self) -> csv.DictWriter:
+        """
+        Get the writer for the streamed report, creating the file on first use.
+
+        Returns:
+            CSV writer with the header already written
+        """
+        if self._csv_writer is None:
+            self._csv_path.parent.mkdir(parents=True, exist_ok=True)
+            self._csv_file = open(self._csv_path, 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=self.CSV_FIELDNAMES)
+            self._csv_writer.writeheader()
+        return self._csv_writer
+
+    def process_file(self, file_path: Path) -> List[Dict[str, any]]:
+        """
+        Process a single HTML file.
+
+        Args:
+            file_path: Path to HTML file
+
+        Returns:
+            List of wrapper chains found
+        """
+        logger.info(f"Processing file: {file_path}")
+        return self.record_file_result(file_path, self.scan_file(file_path))
+
+    def process_directory(
+        self,
+        directory: Path,
+        recursive: bool = False,
+        max_workers: Optional[int] = None,
+        output_csv: Optional[Path] = None
+    ) -> List[Dict[str, any]]:
         """
         Process all HTML files in a directory.
 
+        Files are parsed in a process pool since parsing is CPU-bound; stats
+        and results are aggregated in this process.
+
         Args:
             directory: Path to directory containing HTML files
             recursive: If True, process subdirectories recursively
+            max_workers: Number of worker processes (default: CPU count, 1 = sequential)
+            output_csv: If given, write rows to this CSV as files are scanned
+                        instead of keeping them in self.results; the file is
+                        only created once a row is found
 
         Returns:
-            List of all wrapper chains found
+            List of all wrapper chains found (empty when streaming to output_csv)
         """
         if not directory.exists():
             raise FileNotFoundError(f"Directory not found: {directory}")
@@ -306,10 +599,26 @@ class EmptyListWrapperScanner:
 
         logger.info(f"Found {len(html_files)} HTML file(s)")
 
-        # Process each file
-        for i, html_file in enumerate(html_files, 1):
-            logger.info(f"[{i}/{len(html_files)}] Processing: {html_file.name}")
-            self.process_file(html_file)
+        if output_csv is None:
+            self._scan_files(html_files, max_workers)
+        else:
+            # Stream rows to the report as each file is scanned; like
+            # write_csv_report, no file is written when nothing is found
+            self._csv_path = output_csv
+            try:
+                self._scan_files(html_files, max_workers)
+            finally:
+                if self._csv_file is not None:
+                    self._csv_file.close()
+                self._csv_path = None
+                self._csv_file = None
+                self._csv_writer = None
+
+            if self.stats['total_wrapper_chains']:
+                logger.info(f"✅ CSV report written to: {output_csv}")
+                logger.info(f"   Total rows: {self.stats['total_wrapper_chains']}")
+            else:
+                logger.warning("No results to write")
 
         # Summary
         logger.info("=" * 80)
@@ -323,6 +632,42 @@ class EmptyListWrapperScanner:
 
         return self.results
 
+    def _scan_files(self, html_files: List[Path], max_workers: Optional[int]) -> None:
+        """
+        Scan files sequentially or in a process pool and record each result.
+
+        Args:
+            html_files: HTML files to scan
+            max_workers: Number of worker processes (default: CPU count, 1 = sequential)
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(html_files))
+
+        if workers <= 1:
+            # Sequential processing
+            for i, html_file in enumerate(html_files, 1):
+                logger.info(f"[{i}/{len(html_files)}] Processing: {html_file.name}")
+                self.process_file(html_file)
+        else:
+            # Parallel processing (chunksize amortizes IPC over many small files)
+            logger.info(f"Scanning with {workers} worker processes")
+            chunksize = max(1, min(8, len(html_files) // (workers * 4)))
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(
+                    self.min_nesting_depth,
+                    self.min_wrapper_count,
+                    self.prefilter,
+                    self.stream_threshold_bytes
+                )
+            ) as executor:
+                scanned = executor.map(_scan_file_worker, html_files, chunksize=chunksize)
+
+                for i, (html_file, wrapper_chains) in enumerate(zip(html_files, scanned), 1):
+                    logger.info(f"[{i}/{len(html_files)}] Scanned: {html_file.name}")
+                    self.record_file_result(html_file, wrapper_chains)
+
     def write_csv_report(self, output_path: Path) -> None:
         """
         Write scan results to CSV file.
@@ -340,8 +685,7 @@ class EmptyListWrapperScanner:
 
             # Write CSV
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = ['file', 'line_number', 'nesting_depth', 'wrapper_count', 'parent_path']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer = csv.DictWriter(f, fieldnames=self.CSV_FIELDNAMES)
 
                 writer.writeheader()
                 writer.writerows(self.results)
@@ -354,12 +698,38 @@ class EmptyListWrapperScanner:
             raise
 
 
+# Per-process scanner used by process_directory's worker pool
+_worker_scanner: Optional[EmptyListWrapperScanner] = None
+
+
+def _init_worker(
+    min_nesting_depth: int,
+    min_wrapper_count: int,
+    prefilter: bool,
+    stream_threshold_bytes: Optional[int]
+) -> None:
+    """Create the scanner used by this worker process."""
+    global _worker_scanner
+    _worker_scanner = EmptyListWrapperScanner(
+        min_nesting_depth=min_nesting_depth,
+        min_wrapper_count=min_wrapper_count,
+        prefilter=prefilter,
+        stream_threshold_bytes=stream_threshold_bytes
+    )
+
+
+def _scan_file_worker(file_path: Path) -> List[Dict[str, any]]:
+    """Scan one file in a worker process."""
+    return _worker_scanner.scan_file(file_path)
+
+
 def main(
     directory: Path,
     output_csv: Path,
     recursive: bool = False,
     min_nesting_depth: int = 2,
-    min_wrapper_count: int = 3
+    min_wrapper_count: int = 3,
+    max_workers: Optional[int] = None
 ) -> Dict[str, int]:
     """
     Main function to scan HTML files for empty list wrapper elements.
@@ -370,6 +740,7 @@ def main(
         recursive: If True, process subdirectories recursively
         min_nesting_depth: Minimum nesting depth to report (default: 2)
         min_wrapper_count: Minimum empty wrappers per file to report (default: 3)
+        max_workers: Number of worker processes (default: CPU count)
 
     Returns:
         Statistics dictionary
@@ -378,6 +749,5 @@ def main(
         min_nesting_depth=min_nesting_depth,
         min_wrapper_count=min_wrapper_count
     )
-    scanner.process_directory(directory, recursive=recursive)
-    scanner.write_csv_report(output_csv)
+    scanner.process_directory(directory, recursive=recursive, max_workers=max_workers, output_csv=output_csv)
     return scanner.stats
@@ -16,51 +16,72 @@ Available commands:
 """
 import sys
 import argparse
+import functools
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path (once, so re-imports don't grow sys.path)
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from cli_utils import CommonCLI
 from config import Config, ConfigurationError
-from post_processing.page_hierarchy import NotionPageHierarchy
-from post_processing.get_imported_page_ids import main as get_imported_pages_main
-from post_processing.move_pages_to_database import main as move_pages_main
-from post_processing.categorize_pages import main as categorize_pages_main
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def notion_command(title, log_prefix):
+    """
+    Wrap a command handler with the shared banner, logging and Notion config checks.
+
+    Args:
+        title: Banner title printed before the command runs
+        log_prefix: Log file prefix passed to CommonCLI.setup_logging
+
+    Returns:
+        Decorator for cmd_* functions
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(args):
+            print("=" * 80)
+            print(title)
+            print("=" * 80)
+
+            # Setup logging with module-specific prefix
+            CommonCLI.setup_logging(
+                verbose=args.verbose,
+                quiet=args.quiet,
+                log_prefix=log_prefix
+            )
+
+            # Validate configuration
+            try:
+                Config.validate_notion()
+            except ConfigurationError as e:
+                logger.error(f"Configuration error: {e}")
+                return 1
+
+            return func(args)
+        return wrapper
+    return decorator
+
+
+@notion_command('Move Pages to Database', 'post_processing_move_pages')
 def cmd_move_pages(args):
     """Move pages to a target database."""
-    print("=" * 80)
-    print("Move Pages to Database")
-    print("=" * 80)
-
-    # Setup logging with module-specific prefix
-    CommonCLI.setup_logging(
-        verbose=getattr(args, 'verbose', False),
-        quiet=getattr(args, 'quiet', False),
-        log_prefix='post_processing_move_pages'
-    )
-
-    # Validate configuration
-    try:
-        Config.validate_notion()
-    except ConfigurationError as e:
-        logger.error(f"Configuration error: {e}")
-        return 1
+    from post_processing.move_pages_to_database import main as move_pages_main
 
     logger.info(f"Target database ID: {args.database}")
     logger.info(f"Pages CSV: {args.pages_csv}")
     logger.info(f"Output directory: {args.output_dir}")
-    logger.info(f"Max workers: {args.workers}")
+    logger.info(f"Max workers: {args.workers or 'auto'}")
 
     # Run main function
     try:
-        results = move_pages_main(
+        summary = move_pages_main(
             target_database_id=args.database,
             pages_csv=Path(args.pages_csv),
             api_key=Config.NOTION_API_KEY,
@@ -69,9 +90,9 @@ def cmd_move_pages(args):
             rate_limit_delay=args.rate_limit
         )
 
-        # Calculate success/failure counts
-        success_count = sum(1 for r in results if r.get("success", False))
-        fail_count = len(results) - success_count
+        # Counts were tallied while results streamed to the NDJSON log
+        success_count = summary["success"]
+        fail_count = summary["failed"]
 
         print("\n" + "=" * 80)
         if fail_count == 0:
@@ -81,9 +102,12 @@ def cmd_move_pages(args):
         else:
             print("⚠️  Operations completed with some failures")
         print("=" * 80)
-        print(f"Total pages: {len(results)}")
+        print(f"Total pages: {summary['total']}")
         print(f"Success: {success_count}")
         print(f"Failed: {fail_count}")
+        if summary["failed_page_ids"]:
+            print(f"Failed page IDs: {', '.join(summary['failed_page_ids'])}")
+        print(f"Results log: {summary['results_path']}")
 
         # Return non-zero exit code if there were failures
         return 1 if fail_count > 0 else 0
@@ -93,25 +117,10 @@ def cmd_move_pages(args):
         return 1
 
 
+@notion_command('Get Imported Page IDs', 'post_processing_get_imported_pages')
 def cmd_get_imported_pages(args):
     """Get page IDs of imported KB pages."""
-    print("=" * 80)
-    print("Get Imported Page IDs")
-    print("=" * 80)
-
-    # Setup logging with module-specific prefix
-    CommonCLI.setup_logging(
-        verbose=getattr(args, 'verbose', False),
-        quiet=getattr(args, 'quiet', False),
-        log_prefix='post_processing_get_imported_pages'
-    )
-
-    # Validate configuration
-    try:
-        Config.validate_notion()
-    except ConfigurationError as e:
-        logger.error(f"Configuration error: {e}")
-        return 1
+    from post_processing.get_imported_page_ids import main as get_imported_pages_main
 
     logger.info(f"Parent page IDs: {args.parent_pages}")
     logger.info(f"Filter prefix: {args.prefix}")
@@ -123,7 +132,8 @@ def cmd_get_imported_pages(args):
         api_key=Config.NOTION_API_KEY,
         output_dir=Path(args.output_dir),
         filter_prefix=args.prefix,
-        max_workers=args.workers
+        max_workers=args.workers,
+        rate_limit_delay=args.rate_limit
     )
 
     print("\n" + "=" * 80)
@@ -133,30 +143,16 @@ def cmd_get_imported_pages(args):
     return 0
 
 
+@notion_command('Categorize Pages', 'post_processing_categorize_pages')
 def cmd_categorize_pages(args):
     """Categorize pages by making them sub-items of category pages."""
-    print("=" * 80)
-    print("Categorize Pages")
-    print("=" * 80)
-
-    # Setup logging with module-specific prefix
-    CommonCLI.setup_logging(
-        verbose=getattr(args, 'verbose', False),
-        quiet=getattr(args, 'quiet', False),
-        log_prefix='post_processing_categorize_pages'
-    )
-
-    # Validate configuration
-    try:
-        Config.validate_notion()
-    except ConfigurationError as e:
-        logger.error(f"Configuration error: {e}")
-        return 1
+    from post_processing.categorize_pages import main as categorize_pages_main
 
     logger.info(f"Page list CSV: {args.pl}")
     logger.info(f"Category list CSV: {args.cl}")
     logger.info(f"Database ID: {args.database}")
     logger.info(f"Max workers: {args.workers}")
+    logger.info(f"Bulk Sub-items updates: {args.bulk}")
 
     # Run main function
     try:
@@ -166,7 +162,8 @@ def cmd_categorize_pages(args):
             database_id=args.database,
             api_key=Config.NOTION_API_KEY,
             max_workers=args.workers,
-            rate_limit_delay=args.rate_limit
+            rate_limit_delay=args.rate_limit,
+            bulk=args.bulk
         )
 
         # Calculate success/failure counts
@@ -193,25 +190,10 @@ def cmd_categorize_pages(args):
         return 1
 
 
+@notion_command('Make Notion Page a Sub-Item', 'post_processing_make_subitem')
 def cmd_make_subitem(args):
     """Make a Notion page a sub-item of another page."""
-    print("=" * 80)
-    print("Make Notion Page a Sub-Item")
-    print("=" * 80)
-
-    # Setup logging with module-specific prefix
-    CommonCLI.setup_logging(
-        verbose=getattr(args, 'verbose', False),
-        quiet=getattr(args, 'quiet', False),
-        log_prefix='post_processing_make_subitem'
-    )
-
-    # Validate configuration
-    try:
-        Config.validate_notion()
-    except ConfigurationError as e:
-        logger.error(f"Configuration error: {e}")
-        return 1
+    from post_processing.page_hierarchy import NotionPageHierarchy
 
     logger.info(f"Child page ID: {args.child}")
     logger.info(f"Parent page ID: {args.parent}")
@@ -244,18 +226,8 @@ def cmd_make_subitem(args):
         return 1
 
 
-def main():
-    """Run post-processing from command line."""
-    parser = argparse.ArgumentParser(
-        description="ServiceNow to Notion Migration - Post-processing\n\n"
-                    "Organize and manage Notion pages after import.",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-
-    # Create subparsers for commands
-    subparsers = parser.add_subparsers(dest='command', help='Command to run')
-
-    # Move pages command
+def _add_move_pages_parser(subparsers):
+    """Add the move-pages subcommand."""
     move_parser = subparsers.add_parser(
         'move-pages',
         help='Move pages to a target database',
@@ -282,9 +254,9 @@ def main():
     move_parser.add_argument(
         '--workers',
         type=int,
-        default=4,
+        default=None,
         metavar='N',
-        help='Number of concurrent workers (default: 4)'
+        help='Number of concurrent workers, at most 16 (default: sized to --rate-limit)'
     )
     move_parser.add_argument(
         '--rate-limit',
@@ -305,7 +277,9 @@ def main():
     )
     move_parser.set_defaults(func=cmd_move_pages)
 
-    # Get imported pages command
+
+def _add_get_imported_pages_parser(subparsers):
+    """Add the get-imported-pages subcommand."""
     imported_parser = subparsers.add_parser(
         'get-imported-pages',
         help='Get page IDs of imported KB pages',
@@ -336,6 +310,13 @@ def main():
         metavar='N',
         help='Number of concurrent workers (default: 4)'
     )
+    imported_parser.add_argument(
+        '--rate-limit',
+        type=float,
+        default=0.1,
+        metavar='SECONDS',
+        help='Delay between requests in seconds (default: 0.1)'
+    )
     imported_parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -348,7 +329,9 @@ def main():
     )
     imported_parser.set_defaults(func=cmd_get_imported_pages)
 
-    # Categorize pages command
+
+def _add_categorize_pages_parser(subparsers):
+    """Add the categorize-pages subcommand."""
     categorize_parser = subparsers.add_parser(
         'categorize-pages',
         help='Categorize pages by moving them under category pages',
@@ -386,6 +369,13 @@ def main():
         metavar='SECONDS',
         help='Delay between requests in seconds (default: 0.1)'
     )
+    categorize_parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Link pages that share a category with one Sub-items update per category. '
+             'This only adds pages to the category: a page that already has a '
+             'Parent item keeps it (the default per-page update replaces it)'
+    )
     categorize_parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -398,7 +388,9 @@ def main():
     )
     categorize_parser.set_defaults(func=cmd_categorize_pages)
 
-    # Make subitem command
+
+def _add_make_subitem_parser(subparsers):
+    """Add the make-subitem subcommand."""
     subitem_parser = subparsers.add_parser(
         'make-subitem',
         help='Make a page a sub-item of another',
@@ -438,6 +430,52 @@ def main():
     )
     subitem_parser.set_defaults(func=cmd_make_subitem)
 
+
+# Subcommand name -> parser builder, in --help order
+SUBCOMMAND_BUILDERS = {
+    'move-pages': _add_move_pages_parser,
+    'get-imported-pages': _add_get_imported_pages_parser,
+    'categorize-pages': _add_categorize_pages_parser,
+    'make-subitem': _add_make_subitem_parser,
+}
+
+
+def build_parser(command=None):
+    """
+    Build the argument parser.
+
+    Args:
+        command: If a known subcommand, only its subparser is built
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="ServiceNow to Notion Migration - Post-processing\n\n"
+                    "Organize and manage Notion pages after import.",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    # Command handlers read these directly, so they must always be present
+    parser.set_defaults(verbose=False, quiet=False)
+
+    # Create subparsers for commands
+    subparsers = parser.add_subparsers(dest='command', help='Command to run')
+
+    if command in SUBCOMMAND_BUILDERS:
+        SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        # Top-level help or an unknown command needs every subparser listed
+        for add_parser in SUBCOMMAND_BUILDERS.values():
+            add_parser(subparsers)
+
+    return parser
+
+
+def main():
+    """Run post-processing from command line."""
+    # Only build the subparser for the requested command
+    parser = build_parser(sys.argv[1] if len(sys.argv) > 1 else None)
+
     # Parse arguments
     args = parser.parse_args()
 
@@ -1,15 +1,35 @@
 """Categorize imported pages by moving them under category pages as sub-items."""
 import csv
 import logging
-from pathlib import Path
-from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import random
+import sys
 import time
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Any, NamedTuple, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from post_processing.page_hierarchy import NotionPageHierarchy
+from post_processing.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Larger read buffer for page lists with many rows
+CSV_READ_BUFFER_SIZE = 1 << 20
+
+# Process-wide caches so repeated main() calls skip unchanged work:
+# (api_key, database_id, lookup name) -> property ID
+_property_id_cache: Dict[Tuple[str, str, str], str] = {}
+# (reader name, resolved path, mtime_ns) -> parsed CSV content
+_csv_cache: Dict[Tuple[str, str, int], Any] = {}
+
+
+class CategorizationTask(NamedTuple):
+    """A page to make a sub-item of its category page."""
+    page_id: str
+    category_page_id: str
+    category_path: str
+
 
 class PageCategorizer:
     """
@@ -22,11 +42,19 @@ class PageCategorizer:
     4. Make each page a sub-item of its category page
     """
 
+    # Notion status codes worth retrying: rate limited / temporarily unavailable
+    RETRYABLE_STATUS_CODES = (429, 503)
+
+    # Pages between INFO progress messages
+    PROGRESS_LOG_INTERVAL = 100
+
     def __init__(
         self,
         api_key: str,
         max_workers: int = 4,
-        rate_limit_delay: float = 0.1
+        rate_limit_delay: float = 0.1,
+        dedupe: bool = True,
+        bulk: bool = False
     ):
         """
         Initialize page categorizer.
@@ -34,15 +62,65 @@ class PageCategorizer:
         Args:
             api_key: Notion integration API key
             max_workers: Number of concurrent workers for threading
-            rate_limit_delay: Delay between requests (seconds)
+            rate_limit_delay: Minimum delay between requests across all workers (seconds)
+            dedupe: Categorize each (page_id, category page) pair only once (default: True)
+            bulk: Link pages sharing a category with one "Sub-items" update
+                  (default: False). Bulk linking only appends to the category, so
+                  a page that already has a "Parent item" keeps it; the default
+                  per-page update replaces it.
         """
         self.api_key = api_key
         self.max_workers = max_workers
         self.rate_limit_delay = rate_limit_delay
-        self.hierarchy = NotionPageHierarchy(api_key)
+        self.dedupe = dedupe
+        self.bulk = bulk
+        self.hierarchy = NotionPageHierarchy(api_key, pool_size=max_workers)
+        self.limiter = RateLimiter(rate_limit_delay)
 
         logger.info(f"Page categorizer initialized (max_workers={max_workers})")
 
+    @staticmethod
+    def _iter_csv_columns(csv_path: Path, columns: Tuple[str, ...]) -> Iterator[List[str]]:
+        """
+        Yield the stripped values of the given columns for each CSV row.
+
+        Uses csv.reader with column indexes looked up once from the header
+        instead of building a dict per row. Rows where any of the columns
+        is missing or empty are skipped.
+
+        Args:
+            csv_path: Path to CSV file
+            columns: Required column names, in the order values are yielded
+
+        Yields:
+            List of stripped column values
+
+        Raises:
+            ValueError: If required columns are missing
+        """
+        with open(csv_path, 'r', encoding='utf-8', newline='', buffering=CSV_READ_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+
+            # Validate required columns once, against the header
+            if header is None or set(columns) - set(header):
+                raise ValueError(
+                    f"CSV must have {' and '.join(repr(c) for c in columns)} columns. "
+                    f"Found: {header}"
+                )
+
+            indexes = [header.index(column) for column in columns]
+            min_length = max(indexes) + 1
+
+            for row in reader:
+                if len(row) < min_length:
+                    continue
+                # Plain strip() is cheapest: it returns the same string when
+                # there is nothing to remove, faster than checking first
+                values = [row[i].strip() for i in indexes]
+                if all(values):
+                    yield values
+
     def read_page_list_csv(self, csv_path: Path) -> List[Dict[str, str]]:
         """
         Read page list CSV with page_id and category_path columns.
@@ -62,26 +140,12 @@ class PageCategorizer:
 
         logger.info(f"Reading page list from {csv_path}")
 
-        pages = []
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-
-            # Validate required columns
-            if "page_id" not in reader.fieldnames or "category_path" not in reader.fieldnames:
-                raise ValueError(
-                    f"CSV must have 'page_id' and 'category_path' columns. "
-                    f"Found: {reader.fieldnames}"
-                )
-
-            for row in reader:
-                page_id = row.get("page_id", "").strip()
-                category_path = row.get("category_path", "").strip()
-
-                if page_id and category_path:
-                    pages.append({
-                        "page_id": page_id,
-                        "category_path": category_path
-                    })
+        # Many pages share a category path; interning makes them share one string
+        # (kept for the life of the process, which is fine for this CLI tool)
+        pages = [
+            {"page_id": page_id, "category_path": sys.intern(category_path)}
+            for page_id, category_path in self._iter_csv_columns(csv_path, ("page_id", "category_path"))
+        ]
 
         logger.info(f"Read {len(pages)} pages from CSV")
         return pages
@@ -105,81 +169,215 @@ class PageCategorizer:
 
         logger.info(f"Reading category list from {csv_path}")
 
-        category_map = {}
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        # Interned keys match the interned page category paths by identity on lookup
+        category_map = {
+            sys.intern(full_path): page_id
+            for full_path, page_id in self._iter_csv_columns(csv_path, ("full_path", "page_id"))
+        }
 
-            # Validate required columns
-            if "full_path" not in reader.fieldnames or "page_id" not in reader.fieldnames:
-                raise ValueError(
-                    f"CSV must have 'full_path' and 'page_id' columns. "
-                    f"Found: {reader.fieldnames}"
-                )
+        logger.info(f"Read {len(category_map)} categories from CSV")
+        return category_map
 
-            for row in reader:
-                full_path = row.get("full_path", "").strip()
-                page_id = row.get("page_id", "").strip()
+    def _is_retryable(self, result: Dict[str, Any]) -> bool:
+        """Check whether a failed hierarchy result is a transient rate-limit/availability error."""
+        if result.get("status_code") in self.RETRYABLE_STATUS_CODES:
+            return True
+        error = (result.get("error") or "").lower()
+        return "rate limit" in error or "rate_limited" in error
 
-                if full_path and page_id:
-                    category_map[full_path] = page_id
+    def _call_with_retry(
+        self,
+        func,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Call a hierarchy method, retrying transient failures with exponential backoff.
 
-        logger.info(f"Read {len(category_map)} categories from CSV")
-        return category_map
+        Args:
+            func: Hierarchy method returning a result dict with a "success" key
+            max_attempts: Maximum number of calls
+            base_delay: Backoff delay before the first retry (seconds), doubled per retry
+            max_delay: Upper bound for the computed backoff delay (seconds)
+            **kwargs: Arguments passed to func
+
+        Returns:
+            Result dict of the last attempt
+        """
+        for attempt in range(max_attempts):
+            # Pace requests here so workers overlap their waits with other calls
+            self.limiter.acquire()
+            result = func(**kwargs)
+
+            if result["success"] or attempt == max_attempts - 1 or not self._is_retryable(result):
+                return result
+
+            # Prefer the server's Retry-After over the computed delay
+            delay = result.get("retry_after")
+            if delay is None:
+                delay = min(max_delay, base_delay * 2 ** attempt) + random.uniform(0, 0.25)
+
+            logger.warning(
+                f"Retryable error ({result['error']}), retrying in {delay:.1f}s "
+                f"(attempt {attempt + 2}/{max_attempts})"
+            )
+            time.sleep(delay)
+
+        return result
+
+    def _cached_property_id(self, finder: Callable[[str], Optional[str]], database_id: str) -> Optional[str]:
+        """
+        Look up a database property ID once per process.
+
+        Misses are not cached, so enabling Sub-items later is picked up.
+
+        Args:
+            finder: Hierarchy lookup method (find_parent_item_property / find_subitems_property)
+            database_id: Notion database ID
+
+        Returns:
+            Property ID, or None if not found
+        """
+        key = (self.api_key, database_id, finder.__name__)
+        if key not in _property_id_cache:
+            property_id = finder(database_id)
+            if not property_id:
+                return None
+            _property_id_cache[key] = property_id
+        else:
+            logger.info(f"Using cached {finder.__name__} result for database {database_id}")
+        return _property_id_cache[key]
+
+    def _cached_csv(self, reader: Callable[[Path], Any], csv_path: Path) -> Any:
+        """
+        Read a CSV once per process, re-reading it only when the file changes.
+
+        The cached object is shared between calls and must not be modified.
+
+        Args:
+            reader: CSV reader method (read_page_list_csv / read_category_list_csv)
+            csv_path: Path to CSV file
+
+        Returns:
+            Parsed CSV content as returned by reader
+        """
+        if not csv_path.exists():
+            # Let the reader raise its usual FileNotFoundError
+            return reader(csv_path)
+
+        key = (reader.__name__, str(csv_path.resolve()), csv_path.stat().st_mtime_ns)
+        if key not in _csv_cache:
+            _csv_cache[key] = reader(csv_path)
+        else:
+            logger.info(f"Using cached contents of {csv_path}")
+        return _csv_cache[key]
+
+    def _crossed_progress_step(self, completed: int, added: int, total: int) -> bool:
+        """Check whether the last group finished the batch or crossed a PROGRESS_LOG_INTERVAL boundary."""
+        interval = self.PROGRESS_LOG_INTERVAL
+        return completed == total or completed // interval > (completed - added) // interval
+
+    @staticmethod
+    def _task_result(task: CategorizationTask, success: bool, error: Optional[str]) -> Dict[str, Any]:
+        """Build the result dict reported for one categorization task."""
+        return {
+            "page_id": task.page_id,
+            "category_path": task.category_path,
+            "category_page_id": task.category_page_id,
+            "success": success,
+            "error": error
+        }
 
     def categorize_single_page(
         self,
-        page_id: str,
-        category_page_id: str,
-        category_path: str,
+        task: CategorizationTask,
         parent_property_id: str
     ) -> Dict[str, Any]:
         """
         Categorize a single page by making it a sub-item of category page.
 
         Args:
-            page_id: Page ID to categorize
-            category_page_id: Category page ID (parent)
-            category_path: Category path for logging
+            task: Page ID, category page ID (parent) and category path for logging
             parent_property_id: Pre-cached parent property ID
 
         Returns:
             Result dict with success status
         """
-        logger.debug(f"Categorizing page {page_id} under category '{category_path}'")
+        page_id = task.page_id
+        # Per-page messages are DEBUG and guarded so large batches skip the formatting
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Categorizing page {page_id} under category '{task.category_path}'")
 
         try:
-            result = self.hierarchy.make_subitem_optimized(
+            result = self._call_with_retry(
+                self.hierarchy.make_subitem_optimized,
                 child_page_id=page_id,
-                parent_page_id=category_page_id,
+                parent_page_id=task.category_page_id,
                 parent_property_id=parent_property_id,
                 verify=False
             )
 
             if result["success"]:
-                logger.info(f"✅ Page {page_id} categorized under '{category_path}'")
+                if debug:
+                    logger.debug(f"✅ Page {page_id} categorized under '{task.category_path}'")
             else:
                 logger.error(
                     f"Failed to categorize page {page_id}: {result.get('error')}"
                 )
 
-            return {
-                "page_id": page_id,
-                "category_path": category_path,
-                "category_page_id": category_page_id,
-                "success": result["success"],
-                "error": result.get("error")
-            }
+            return self._task_result(task, result["success"], result.get("error"))
 
         except Exception as e:
             error_msg = f"Exception categorizing page {page_id}: {e}"
             logger.error(error_msg)
-            return {
-                "page_id": page_id,
-                "category_path": category_path,
-                "category_page_id": category_page_id,
-                "success": False,
-                "error": str(e)
-            }
+            return self._task_result(task, False, str(e))
+
+    def categorize_page_group(
+        self,
+        tasks: List[CategorizationTask],
+        subitems_property_id: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Categorize pages that share one category page with a single bulk update.
+
+        All pages are linked with one update of the category's "Sub-items"
+        relation, so at most MAX_RELATIONS_PER_UPDATE tasks can be passed. This
+        adds the pages to the category without clearing a "Parent item" they
+        already have, unlike categorize_single_page.
+
+        Args:
+            tasks: Tasks with the same category_page_id
+            subitems_property_id: Pre-cached "Sub-items" property ID
+
+        Returns:
+            List of result dicts, one per task, or None if the bulk update failed
+            and the pages should be categorized individually
+        """
+        category_page_id = tasks[0].category_page_id
+        category_path = tasks[0].category_path
+
+        # Extra slot for reading the existing sub-items before the PATCH
+        self.limiter.acquire()
+        result = self._call_with_retry(
+            self.hierarchy.make_subitems_bulk,
+            parent_page_id=category_page_id,
+            child_page_ids=[task.page_id for task in tasks],
+            subitems_property_id=subitems_property_id
+        )
+
+        if not result["success"]:
+            logger.warning(
+                f"Bulk categorization under '{category_path}' failed ({result['error']}), "
+                "falling back to per-page updates"
+            )
+            return None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"✅ {len(tasks)} pages categorized under '{category_path}'")
+        return [self._task_result(task, True, None) for task in tasks]
 
     def categorize_pages_batch(
         self,
@@ -204,7 +402,7 @@ class PageCategorizer:
 
         # Get parent property ID once (performance optimization)
         logger.info("Fetching parent property ID from database")
-        parent_property_id = self.hierarchy.find_parent_item_property(database_id)
+        parent_property_id = self._cached_property_id(self.hierarchy.find_parent_item_property, database_id)
 
         if not parent_property_id:
             raise ValueError(
@@ -214,85 +412,148 @@ class PageCategorizer:
 
         logger.info(f"✅ Using parent property ID: {parent_property_id}")
 
-        # Build list of categorization tasks
-        tasks = []
-        skipped = 0
+        # The "Sub-items" side lets one PATCH link many pages to a category
+        subitems_property_id = None
+        if self.bulk:
+            subitems_property_id = self._cached_property_id(self.hierarchy.find_subitems_property, database_id)
+            if not subitems_property_id:
+                logger.info("No 'Sub-items' property found, categorizing page by page")
+
+        # Build categorization tasks grouped by category page
+        groups = defaultdict(list)
+        task_count = 0
+        missing = Counter()  # Unknown category_path -> pages skipped
+        seen = set()  # (page_id, category_page_id) already queued
+        duplicates = 0
 
         for page in pages:
-            page_id = page["page_id"]
             category_path = page["category_path"]
 
-            # Find category page ID
-            category_page_id = category_map.get(category_path)
-
-            if not category_page_id:
-                logger.warning(
-                    f"Category '{category_path}' not found in category list. "
-                    f"Skipping page {page_id}"
-                )
-                skipped += 1
+            # Find category page ID (most pages have one, so look up directly)
+            try:
+                category_page_id = category_map[category_path]
+            except KeyError:
+                missing[category_path] += 1
                 continue
 
-            tasks.append({
-                "page_id": page_id,
-                "category_page_id": category_page_id,
-                "category_path": category_path,
-                "parent_property_id": parent_property_id
-            })
+            # Repeated CSV rows would only re-send the same PATCH
+            if self.dedupe:
+                key = (page["page_id"], category_page_id)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
 
-        if skipped > 0:
-            logger.warning(f"Skipped {skipped} pages with unknown categories")
-
-        logger.info(f"Categorizing {len(tasks)} pages with {self.max_workers} workers")
-
-        # Execute with threading
-        results = []
-
-        if self.max_workers == 1:
-            # Sequential processing
-            for i, task in enumerate(tasks, 1):
-                if i % 10 == 0:
-                    logger.info(f"Progress: {i}/{len(tasks)} pages categorized")
+            groups[category_page_id].append(
+                CategorizationTask(page["page_id"], category_page_id, category_path)
+            )
+            task_count += 1
 
-                result = self.categorize_single_page(**task)
-                results.append(result)
-                time.sleep(self.rate_limit_delay)
-        else:
-            # Parallel processing
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_task = {
-                    executor.submit(self.categorize_single_page, **task): task
-                    for task in tasks
-                }
+        # One aggregate warning instead of one per skipped page
+        skipped = sum(missing.values())
+        if skipped > 0:
+            logger.warning(
+                f"Skipped {skipped} pages across {len(missing)} categories not found in "
+                f"category list (most common: {missing.most_common(5)})"
+            )
 
-                completed = 0
-                for future in as_completed(future_to_task):
-                    task = future_to_task[future]
+        if duplicates > 0:
+            logger.info(f"Skipped {duplicates} duplicate page rows")
+
+        logger.info(
+            f"Categorizing {task_count} pages under {len(groups)} categories "
+            f"with {self.max_workers} workers"
+        )
+
+        # Execute with threading; each group fills its own slice of the
+        # preallocated results, so they come back in task-building order
+        results: List[Optional[Dict[str, Any]]] = [None] * task_count
+        group_offsets = []
+        offset = 0
+        for tasks in groups.values():
+            group_offsets.append((offset, tasks))
+            offset += len(tasks)
+
+        completed = 0
+        success_count = 0
+        max_bulk = self.hierarchy.MAX_RELATIONS_PER_UPDATE
+        window = self.max_workers * 4
+
+        def iter_jobs() -> Iterator[Tuple[int, List[CategorizationTask], bool]]:
+            """Yield (offset, tasks, bulk) jobs: one bulk job per linkable group, else one job per page."""
+            for offset, tasks in group_offsets:
+                if subitems_property_id and len(tasks) > 1:
+                    yield offset, tasks, True
+                else:
+                    for i, task in enumerate(tasks):
+                        yield offset + i, [task], False
+
+        pending_jobs = iter_jobs()
+        # Per-page jobs queued by finished bulk jobs: pages past max_bulk, or the
+        # whole group when the bulk update failed. They only start once the bulk
+        # PATCH is done, since it replaces the category's whole Sub-items list.
+        followup_jobs = deque()
+
+        # Only a window of max_workers * 4 futures is in flight; each completion
+        # submits the next job. max_workers=1 runs them one at a time.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_job = {}
+
+            def submit_next() -> bool:
+                if followup_jobs:
+                    job = followup_jobs.popleft()
+                else:
+                    job = next(pending_jobs, None)
+                    if job is None:
+                        return False
+
+                offset, tasks, bulk = job
+                if bulk:
+                    future = executor.submit(
+                        self.categorize_page_group, tasks[:max_bulk], subitems_property_id
+                    )
+                else:
+                    future = executor.submit(self.categorize_single_page, tasks[0], parent_property_id)
+                future_to_job[future] = job
+                return True
+
+            def queue_single_pages(offset: int, tasks: List[CategorizationTask]) -> None:
+                followup_jobs.extend((offset + i, [task], False) for i, task in enumerate(tasks))
+
+            while len(future_to_job) < window and submit_next():
+                pass
+
+            while future_to_job:
+                done, _ = wait(future_to_job, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    offset, tasks, bulk = future_to_job.pop(future)
 
                     try:
-                        result = future.result()
-                        results.append(result)
-                        completed += 1
-
-                        if completed % 10 == 0 or completed == len(tasks):
-                            logger.info(f"Progress: {completed}/{len(tasks)} pages processed")
-
+                        job_results = future.result() if bulk else [future.result()]
                     except Exception as e:
-                        logger.error(f"Exception processing page {task['page_id']}: {e}")
-                        results.append({
-                            "page_id": task["page_id"],
-                            "category_path": task["category_path"],
-                            "category_page_id": task["category_page_id"],
-                            "success": False,
-                            "error": str(e)
-                        })
-
-                    # Rate limiting
-                    time.sleep(self.rate_limit_delay)
+                        logger.error(
+                            f"Exception processing category '{tasks[0].category_path}': {e}"
+                        )
+                        job_results = None if bulk else [self._task_result(tasks[0], False, str(e))]
+
+                    if bulk:
+                        if job_results is None:
+                            job_results = []
+                        queue_single_pages(offset + len(job_results), tasks[len(job_results):])
+
+                    results[offset:offset + len(job_results)] = job_results
+                    success_count += sum(r["success"] for r in job_results)
+                    completed += len(job_results)
+                    if job_results and self._crossed_progress_step(completed, len(job_results), task_count):
+                        logger.info(f"Progress: {completed}/{task_count} pages processed")
+
+                # Refill the window, including follow-up jobs queued above
+                while len(future_to_job) < window and submit_next():
+                    pass
 
         # Summary
-        success_count = sum(1 for r in results if r["success"])
-        fail_count = len(results) - success_count
+        fail_count = task_count - success_count
 
         logger.info("=" * 80)
         logger.info("Categorization Complete")
@@ -323,8 +584,8 @@ class PageCategorizer:
             List of result dicts
         """
         # Read CSVs
-        pages = self.read_page_list_csv(page_list_csv)
-        category_map = self.read_category_list_csv(category_list_csv)
+        pages = self._cached_csv(self.read_page_list_csv, page_list_csv)
+        category_map = self._cached_csv(self.read_category_list_csv, category_list_csv)
 
         # Categorize pages
         results = self.categorize_pages_batch(pages, category_map, database_id)
@@ -338,7 +599,8 @@ def main(
     database_id: str,
     api_key: str,
     max_workers: int = 4,
-    rate_limit_delay: float = 0.1
+    rate_limit_delay: float = 0.1,
+    bulk: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Main function to categorize pages.
@@ -350,6 +612,8 @@ def main(
         api_key: Notion API key
         max_workers: Number of concurrent workers
         rate_limit_delay: Delay between requests (seconds)
+        bulk: Link pages sharing a category with one update, keeping any
+              existing "Parent item" (see PageCategorizer)
 
     Returns:
         List of result dicts
@@ -357,11 +621,15 @@ def main(
     categorizer = PageCategorizer(
         api_key=api_key,
         max_workers=max_workers,
-        rate_limit_delay=rate_limit_delay
+        rate_limit_delay=rate_limit_delay,
+        bulk=bulk
     )
 
-    return categorizer.categorize_pages(
-        page_list_csv=page_list_csv,
-        category_list_csv=category_list_csv,
-        database_id=database_id
-    )
+    try:
+        return categorizer.categorize_pages(
+            page_list_csv=page_list_csv,
+            category_list_csv=category_list_csv,
+            database_id=database_id
+        )
+    finally:
+        categorizer.hierarchy.close()
@@ -1,14 +1,26 @@
 """Create category hierarchy in Notion database based on article list."""
 import csv
+import hashlib
 import logging
+import re
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from post_processing.page_hierarchy import NotionPageHierarchy
+from post_processing.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# A separator with extra whitespace on either side; paths without one are already normalized
+_PADDED_SEPARATOR = re.compile(r'\s > | > \s')
+
+# Process-wide cache shared by all organizers: (api_key, database_id) -> parent property ID
+_parent_property_cache: Dict[Tuple[str, str], str] = {}
+
 
 class CategoryOrganizer:
     """
@@ -24,6 +36,7 @@ class CategoryOrganizer:
     - Cache parent property ID (fetch once, reuse for all relationships)
     - Cache created page IDs immediately after creation
     - Bulk operations with minimal API calls
+    - Create category pages concurrently, paced by a shared rate limiter
 
     Example:
         organizer = CategoryOrganizer(
@@ -42,7 +55,10 @@ class CategoryOrganizer:
         database_id: str,
         csv_path: Optional[str] = None,
         dry_run: bool = False,
-        output_dir: str = "./migration_output"
+        output_dir: str = "./migration_output",
+        max_workers: int = 4,
+        rate_limit_delay: float = 0.1,
+        existing_mapping: Optional[str] = None
     ):
         """
         Initialize category organizer.
@@ -53,6 +69,10 @@ class CategoryOrganizer:
             csv_path: Path to article list CSV file (optional)
             dry_run: If True, preview operations without creating pages
             output_dir: Directory to save output CSV files
+            max_workers: Number of concurrent workers for page creation
+            rate_limit_delay: Minimum delay between requests across all workers (seconds)
+            existing_mapping: Category mapping CSV from a previous run; categories
+                listed there reuse their page instead of creating a new one
         """
         self.api_key = api_key
         self.database_id = database_id
@@ -60,34 +80,108 @@ class CategoryOrganizer:
         self.dry_run = dry_run
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
 
-        self.hierarchy = NotionPageHierarchy(api_key)
+        # Page creation shares the hierarchy's pooled session, sized for the worker threads
+        self.hierarchy = NotionPageHierarchy(api_key, pool_size=max_workers)
+        self.limiter = RateLimiter(rate_limit_delay)
         self.category_pages: Dict[str, str] = {}  # category_path -> page_id
 
         # Performance optimization: cache parent property ID
         self._parent_property_id: Optional[str] = None
 
+        # category_path -> page_id of pages created by an earlier run
+        self._existing_pages: Dict[str, str] = {}
+        if existing_mapping:
+            self._existing_pages = self.load_category_mapping(existing_mapping)
+
         logger.info(f"Category organizer initialized (dry_run={dry_run})")
 
     def _get_parent_property_id(self) -> Optional[str]:
         """
         Get parent property ID with caching.
-        Fetch once from database, then reuse for all subsequent operations.
+        Fetch once per database and process, then reuse for all subsequent
+        operations, including those of other organizer instances.
 
         Returns:
             Parent property ID or None if not found
         """
         if self._parent_property_id is None:
-            logger.info("Fetching parent property ID (first time only)")
-            self._parent_property_id = self.hierarchy.find_parent_item_property(self.database_id)
+            key = (self.api_key, self.database_id)
 
-            if self._parent_property_id:
-                logger.info(f"✅ Cached parent property ID: {self._parent_property_id}")
+            if key in _parent_property_cache:
+                self._parent_property_id = _parent_property_cache[key]
+                logger.info(f"Using cached parent property ID: {self._parent_property_id}")
             else:
-                logger.warning("⚠️  Parent property not found - Sub-items feature may not be enabled")
+                logger.info("Fetching parent property ID (first time only)")
+                self._parent_property_id = self.hierarchy.find_parent_item_property(self.database_id)
+
+                if self._parent_property_id:
+                    # Only successful lookups are shared, so a later run can retry a miss
+                    _parent_property_cache[key] = self._parent_property_id
+                    logger.info(f"✅ Cached parent property ID: {self._parent_property_id}")
+                else:
+                    logger.warning("⚠️  Parent property not found - Sub-items feature may not be enabled")
 
         return self._parent_property_id
 
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self.hierarchy.close()
+
+    @staticmethod
+    def load_category_mapping(mapping_path: str) -> Dict[str, str]:
+        """
+        Load category page IDs from a previous run's export.
+
+        Accepts either the mapping CSV written by export_category_mapping()
+        (category_path, page_id) or the hierarchy CSV (full_path, page_id).
+        Rows without a page ID or with a dry-run placeholder ID are ignored.
+
+        Args:
+            mapping_path: Path to mapping or hierarchy CSV
+
+        Returns:
+            Dictionary mapping category_path to page_id
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the path or page_id column is missing
+        """
+        logger.info(f"Loading existing category pages from {mapping_path}")
+
+        pages: Dict[str, str] = {}
+
+        with open(mapping_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+
+            path_column = 'category_path' if 'category_path' in header else 'full_path'
+            if path_column not in header or 'page_id' not in header:
+                raise ValueError(
+                    f"{mapping_path} needs a category_path (or full_path) and a page_id column"
+                )
+
+            path_index = header.index(path_column)
+            id_index = header.index('page_id')
+
+            for row in reader:
+                if len(row) <= max(path_index, id_index):
+                    continue
+
+                page_id = row[id_index].strip()
+                if page_id and not page_id.startswith('dry_run_page_'):
+                    pages[sys.intern(row[path_index].strip())] = page_id
+
+        logger.info(f"Loaded {len(pages)} existing category pages")
+        return pages
+
+    def __enter__(self) -> "CategoryOrganizer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def extract_category_paths_from_csv(
         self,
         csv_path: Optional[str] = None
@@ -111,17 +205,33 @@ class CategoryOrganizer:
 
         logger.info(f"Reading category paths from {csv_path}")
 
-        category_paths = set()
+        # Many articles share a category, so collect the distinct raw values first
+        raw_paths = set()
+
+        with open(csv_file, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+
+            if 'category_path' not in header:
+                logger.warning(f"No 'category_path' column in {csv_path}")
+                return []
 
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            path_index = header.index('category_path')
 
             for row in reader:
-                category_path = row.get('category_path', '').strip()
-                if category_path:
-                    # Normalize: remove extra spaces around separators
-                    normalized_path = ' > '.join([p.strip() for p in category_path.split(' > ')])
-                    category_paths.add(normalized_path)
+                if len(row) > path_index:
+                    raw_paths.add(row[path_index])
+
+        category_paths = set()
+        for raw_path in raw_paths:
+            category_path = raw_path.strip()
+            if not category_path:
+                continue
+
+            if _PADDED_SEPARATOR.search(category_path):
+                # Normalize: remove extra spaces around separators
+                category_path = ' > '.join([p.strip() for p in category_path.split(' > ')])
+            category_paths.add(category_path)
 
         # Sort by depth (number of separators) to ensure parents are created first
         sorted_paths = sorted(
@@ -150,31 +260,55 @@ class CategoryOrganizer:
         tree = {}
 
         for path in category_paths:
-            parts = [p.strip() for p in path.split(' > ')]
+            parent_path = None
 
-            # Build each level of the path
-            for i in range(len(parts)):
-                current_path = ' > '.join(parts[:i+1])
+            # Extend the path one level at a time instead of re-joining every prefix
+            for depth, name in enumerate(p.strip() for p in path.split(' > ')):
+                # Interned so tree keys, parent_path/children references and
+                # category_pages keys all share one string object per path
+                name = sys.intern(name)
+                current_path = name if parent_path is None else sys.intern(f"{parent_path} > {name}")
 
                 if current_path not in tree:
-                    parent_path = ' > '.join(parts[:i]) if i > 0 else None
-
                     tree[current_path] = {
                         'full_path': current_path,
-                        'name': parts[i],
+                        'name': name,
                         'parent_path': parent_path,
-                        'depth': i,
+                        'depth': depth,
                         'children': []
                     }
 
-                    # Add to parent's children list
-                    if parent_path and parent_path in tree:
-                        if current_path not in tree[parent_path]['children']:
-                            tree[parent_path]['children'].append(current_path)
+                    # Each node is created once, so it is added to its parent exactly once
+                    if parent_path is not None:
+                        tree[parent_path]['children'].append(current_path)
+
+                parent_path = current_path
 
         logger.info(f"Built tree with {len(tree)} category nodes")
         return tree
 
+    @staticmethod
+    def _paths_by_depth(tree: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        Order tree paths so parent categories come before their children.
+
+        Walks the tree breadth-first from the roots, so each level follows the
+        previous one without sorting every path; siblings are sorted by name.
+
+        Args:
+            tree: Parsed category tree structure
+
+        Returns:
+            Category paths ordered level by level
+        """
+        ordered = sorted(path for path, node in tree.items() if node['parent_path'] is None)
+
+        # The list is the BFS queue: children appended here are visited in turn
+        for path in ordered:
+            ordered.extend(sorted(tree[path]['children']))
+
+        return ordered
+
     def create_category_page(
         self,
         category_name: str,
@@ -188,23 +322,30 @@ class CategoryOrganizer:
             category_path: Full path for uniqueness (e.g., "IT > FAQ")
 
         Returns:
-            Page ID of created page, or None if dry_run or error
+            Page ID of created (or previously created) page, placeholder ID in
+            dry run, or None on error
         """
+        existing_page_id = self._existing_pages.get(category_path)
+        if existing_page_id:
+            logger.info(f"Reusing existing category page: {category_name} (ID: {existing_page_id})")
+            self.category_pages[category_path] = existing_page_id
+            return existing_page_id
+
         if self.dry_run:
-            logger.info(f"[DRY RUN] Would create category page: {category_name} ({category_path})")
-            return f"dry_run_page_{hash(category_path)}"
+            # Per-page detail only at DEBUG; build_category_hierarchy logs a per-depth summary
+            logger.debug(f"[DRY RUN] Would create category page: {category_name} ({category_path})")
+            # Stable across runs (unlike hash(), which is salted per process) so dry-run exports diff cleanly
+            digest = hashlib.blake2b(category_path.encode('utf-8'), digest_size=8).hexdigest()
+            page_id = f"dry_run_page_{digest}"
+
+            # Cache like a real page so children can be previewed under it
+            self.category_pages[category_path] = page_id
+            return page_id
 
         logger.info(f"Creating category page: {category_name}")
 
         try:
-            import requests
-
-            url = "https://api.notion.com/v1/pages"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "Notion-Version": "2022-06-28",
-            }
+            url = f"{self.hierarchy.base_url}/pages"
 
             payload = {
                 "parent": {
@@ -223,7 +364,8 @@ class CategoryOrganizer:
                 }
             }
 
-            response = requests.post(url, headers=headers, json=payload)
+            self.limiter.acquire()
+            response = self.hierarchy.session.post(url, json=payload)
             response.raise_for_status()
 
             page = response.json()
@@ -240,6 +382,80 @@ class CategoryOrganizer:
             logger.error(f"Failed to create category page '{category_name}': {e}")
             return None
 
+    def link_category_children(
+        self,
+        parent_path: str,
+        parent_page_id: str,
+        children: List[Tuple[str, str]],
+        parent_property_id: Optional[str],
+        subitems_property_id: Optional[str]
+    ) -> Tuple[int, List[str]]:
+        """
+        Make all child categories of one parent its sub-items.
+
+        With more than one child, the parent's "Sub-items" relation is set in a
+        single request; otherwise, or if that fails, each child is linked on its own.
+
+        Args:
+            parent_path: Parent category path (for logging)
+            parent_page_id: Parent category page ID
+            children: (category_path, page_id) of each child category
+            parent_property_id: Pre-cached "Parent item" property ID
+            subitems_property_id: Pre-cached "Sub-items" property ID, or None
+
+        Returns:
+            Tuple of (relationships created, error messages)
+        """
+        if subitems_property_id and len(children) > 1:
+            logger.debug(f"Making {len(children)} categories sub-items of '{parent_path}'")
+
+            # One slot for reading the existing sub-items, one for the PATCH
+            self.limiter.acquire()
+            self.limiter.acquire()
+            bulk_result = self.hierarchy.make_subitems_bulk(
+                parent_page_id=parent_page_id,
+                child_page_ids=[page_id for _, page_id in children],
+                subitems_property_id=subitems_property_id
+            )
+
+            if bulk_result['success']:
+                return len(children), []
+
+            logger.warning(
+                f"Bulk linking under '{parent_path}' failed ({bulk_result['error']}), "
+                "falling back to per-category updates"
+            )
+
+        linked = 0
+        errors = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        for category_path, child_page_id in children:
+            # Create parent-child relationship with optimized call
+            if debug_enabled:
+                logger.debug(f"Making '{category_path}' a sub-item of '{parent_path}'")
+
+            # PERFORMANCE: Use pre-cached property ID
+            self.limiter.acquire()
+            relation_result = self.hierarchy.make_subitem_optimized(
+                child_page_id=child_page_id,
+                parent_page_id=parent_page_id,
+                parent_property_id=parent_property_id,
+                verify=False
+            )
+
+            if relation_result['success']:
+                linked += 1
+            else:
+                error_msg = (
+                    f"Failed to create relationship {category_path} -> {parent_path}: "
+                    f"{relation_result.get('error')}"
+                )
+                logger.error(error_msg)
+                errors.append(error_msg)
+
+        return linked, errors
+
     def build_category_hierarchy(
         self,
         csv_path: Optional[str] = None
@@ -266,6 +482,7 @@ class CategoryOrganizer:
         result = {
             'success': False,
             'categories_created': 0,
+            'categories_reused': 0,
             'relationships_created': 0,
             'category_pages': {},
             'csv_export_path': None,
@@ -296,104 +513,160 @@ class CategoryOrganizer:
             if not parent_property_id and not self.dry_run:
                 logger.warning("⚠️  Could not find parent property - relationships may fail")
 
+            # The "Sub-items" side lets one PATCH link all children of a parent
+            subitems_property_id = None
+            if not self.dry_run:
+                subitems_property_id = self.hierarchy.find_subitems_property(self.database_id)
+
             # Step 4: Create Notion pages for each category
             logger.info("Step 4: Creating Notion pages for categories")
             logger.info("-" * 80)
 
             # Sort tree paths by depth to ensure parents are created first
-            all_tree_paths = sorted(
-                tree.keys(),
-                key=lambda p: (p.count(' > '), p)
-            )
-
-            for i, category_path in enumerate(all_tree_paths, 1):
-                category_info = tree[category_path]
-                category_name = category_info['name']
-
-                if i % 10 == 0:
-                    logger.info(f"Progress: {i}/{len(all_tree_paths)} categories created")
-
-                page_id = self.create_category_page(category_name, category_path)
-
-                if page_id:
-                    result['categories_created'] += 1
+            all_tree_paths = self._paths_by_depth(tree)
+
+            # parent_path -> [(child path, child page ID)], linked per parent in Step 5
+            children_by_parent: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+            # parent_path -> children not yet through the creation loop
+            pending_children = {path: len(node['children']) for path, node in tree.items() if node['children']}
+
+            def create(path: str) -> Optional[str]:
+                return self.create_category_page(tree[path]['name'], path)
+
+            def link(parent_path: str) -> Tuple[int, List[str]]:
+                return self.link_category_children(
+                    parent_path,
+                    tree[parent_path]['page_id'],
+                    children_by_parent[parent_path],
+                    parent_property_id,
+                    subitems_property_id
+                )
+
+            # Pages are independent until Step 5 links them, so create them concurrently.
+            # A parent's children are linked as soon as the last of them is created, on a
+            # second pool, so linking overlaps creation of deeper levels; the shared limiter
+            # paces both. Dry run only fabricates IDs, which isn't worth a thread pool.
+            create_executor = link_executor = None
+            if not self.dry_run:
+                create_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                link_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            link_futures = []
+
+            try:
+                if create_executor is None:
+                    page_ids = map(create, all_tree_paths)
                 else:
-                    error_msg = f"Failed to create page for category: {category_path}"
-                    logger.error(error_msg)
-                    result['errors'].append(error_msg)
+                    page_ids = create_executor.map(create, all_tree_paths)
 
-            logger.info("-" * 80)
-            logger.info(f"Created {result['categories_created']} category pages")
-
-            # Step 5: Establish parent-child relationships (OPTIMIZED)
-            logger.info("Step 5: Establishing parent-child relationships")
-            logger.info("-" * 80)
+                # Checked once, so per-category log messages aren't formatted when filtered out
+                progress_enabled = logger.isEnabledFor(logging.INFO)
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                total = len(all_tree_paths)
 
-            for i, category_path in enumerate(all_tree_paths, 1):
-                category_info = tree[category_path]
-                parent_path = category_info['parent_path']
+                # Results arrive in path order, so each parent's page already exists
+                # when its children come through; their links are collected in the same pass
+                for i, (category_path, page_id) in enumerate(zip(all_tree_paths, page_ids), 1):
+                    if progress_enabled and i % 10 == 0:
+                        logger.info(f"Progress: {i}/{total} categories created")
 
-                if not parent_path:
-                    logger.debug(f"Root category: {category_path}")
-                    continue
-
-                child_page_id = self.category_pages.get(category_path)
-                parent_page_id = self.category_pages.get(parent_path)
-
-                if not child_page_id or not parent_page_id:
-                    error_msg = f"Missing page IDs for relationship: {category_path} -> {parent_path}"
-                    logger.error(error_msg)
-                    result['errors'].append(error_msg)
-                    continue
+                    node = tree[category_path]
+                    parent_path = node['parent_path']
 
-                if i % 10 == 0:
-                    logger.info(f"Progress: {i}/{len(all_tree_paths)} relationships processed")
+                    if not page_id:
+                        error_msg = f"Failed to create page for category: {category_path}"
+                        logger.error(error_msg)
+                        result['errors'].append(error_msg)
+                    else:
+                        if category_path in self._existing_pages:
+                            result['categories_reused'] += 1
+                        else:
+                            result['categories_created'] += 1
+
+                        # Kept on the node so linking reads the parent's ID straight off the tree
+                        node['page_id'] = page_id
+
+                        if not parent_path:
+                            if debug_enabled:
+                                logger.debug(f"Root category: {category_path}")
+                        elif not tree[parent_path].get('page_id'):
+                            error_msg = f"Missing page IDs for relationship: {category_path} -> {parent_path}"
+                            logger.error(error_msg)
+                            result['errors'].append(error_msg)
+                        elif self.dry_run:
+                            if debug_enabled:
+                                logger.debug(
+                                    f"[DRY RUN] Would make '{category_path}' "
+                                    f"a sub-item of '{parent_path}'"
+                                )
+                            result['relationships_created'] += 1
+                        else:
+                            children_by_parent[parent_path].append((category_path, page_id))
+
+                    if parent_path:
+                        pending_children[parent_path] -= 1
+                        if (
+                            pending_children[parent_path] == 0
+                            and parent_path in children_by_parent
+                            and link_executor is not None
+                        ):
+                            link_futures.append(link_executor.submit(link, parent_path))
+
+                # Worker threads recorded pages in completion order; restore path order
+                # (parents before children) for the mapping export. Pages from outside
+                # this tree keep their place after it.
+                ordered_pages = {
+                    path: self.category_pages[path] for path in all_tree_paths if path in self.category_pages
+                }
+                ordered_pages.update(self.category_pages)
+                self.category_pages = ordered_pages
 
                 if self.dry_run:
-                    logger.info(
-                        f"[DRY RUN] Would make '{category_path}' "
-                        f"a sub-item of '{parent_path}'"
-                    )
-                    result['relationships_created'] += 1
-                else:
-                    # Create parent-child relationship with optimized call
-                    logger.debug(f"Making '{category_path}' a sub-item of '{parent_path}'")
-
-                    # PERFORMANCE: Use pre-cached property ID
-                    relation_result = self.hierarchy.make_subitem_optimized(
-                        child_page_id=child_page_id,
-                        parent_page_id=parent_page_id,
-                        parent_property_id=parent_property_id,
-                        verify=False
+                    # One line per level instead of one per category (use -v for per-category detail)
+                    depth_counts = Counter(
+                        tree[path]['depth'] for path in all_tree_paths if path not in self._existing_pages
                     )
-
-                    if relation_result['success']:
-                        result['relationships_created'] += 1
-                    else:
-                        error_msg = (
-                            f"Failed to create relationship {category_path} -> {parent_path}: "
-                            f"{relation_result.get('error')}"
-                        )
-                        logger.error(error_msg)
-                        result['errors'].append(error_msg)
+                    for depth in sorted(depth_counts):
+                        logger.info(f"[DRY RUN] Depth {depth}: would create {depth_counts[depth]} category pages")
+                    logger.info(f"[DRY RUN] Would create {result['relationships_created']} parent-child relationships")
+
+                logger.info("-" * 80)
+                logger.info(
+                    f"Created {result['categories_created']} category pages, "
+                    f"reused {result['categories_reused']}"
+                )
+
+                # Step 5: Establish parent-child relationships (OPTIMIZED)
+                logger.info("Step 5: Establishing parent-child relationships")
+                logger.info("-" * 80)
+
+                # Links already started during Step 4; collect them in submission order
+                for future in link_futures:
+                    linked, errors = future.result()
+                    result['relationships_created'] += linked
+                    result['errors'].extend(errors)
+            finally:
+                for executor in (create_executor, link_executor):
+                    if executor is not None:
+                        executor.shutdown()
 
             logger.info("-" * 80)
             logger.info(f"Established {result['relationships_created']} parent-child relationships")
 
             # Step 6: Export to CSV
             logger.info("Step 6: Exporting category hierarchy to CSV")
-            csv_export_path = self.export_category_hierarchy_csv(tree)
+            csv_export_path = self.export_category_hierarchy_csv(tree, all_tree_paths)
             result['csv_export_path'] = csv_export_path
             logger.info(f"✅ CSV exported to: {csv_export_path}")
 
-            # Store category page mapping in result
-            result['category_pages'] = self.category_pages.copy()
+            # Store category page mapping in result (shared, not copied: the build is finished)
+            result['category_pages'] = self.category_pages
 
             # Final summary
             logger.info("=" * 80)
             logger.info("Category Hierarchy Build Complete")
             logger.info("=" * 80)
             logger.info(f"Categories created:     {result['categories_created']}")
+            logger.info(f"Categories reused:      {result['categories_reused']}")
             logger.info(f"Relationships created:  {result['relationships_created']}")
             logger.info(f"CSV export:             {csv_export_path}")
             logger.info(f"Errors encountered:     {len(result['errors'])}")
@@ -409,12 +682,17 @@ class CategoryOrganizer:
             result['errors'].append(error_msg)
             return result
 
-    def export_category_hierarchy_csv(self, tree: Dict[str, Dict[str, Any]]) -> str:
+    def export_category_hierarchy_csv(
+        self,
+        tree: Dict[str, Dict[str, Any]],
+        sorted_paths: Optional[List[str]] = None
+    ) -> str:
         """
         Export category hierarchy to CSV with page IDs and structure information.
 
         Args:
             tree: Parsed category tree structure
+            sorted_paths: Tree paths already sorted by depth (computed if omitted)
 
         Returns:
             Path to created CSV file
@@ -428,7 +706,11 @@ class CategoryOrganizer:
 
         logger.info(f"Exporting category hierarchy to {csv_path}")
 
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        # Sort by depth for readability
+        if sorted_paths is None:
+            sorted_paths = self._paths_by_depth(tree)
+
+        with open(csv_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
             writer = csv.writer(f)
 
             # Header
@@ -441,25 +723,18 @@ class CategoryOrganizer:
                 'children_count'
             ])
 
-            # Sort by depth for readability
-            sorted_paths = sorted(
-                tree.keys(),
-                key=lambda p: (p.count(' > '), p)
+            writer.writerows(
+                (
+                    info['name'],
+                    info['full_path'],
+                    info['depth'],
+                    info['parent_path'] or '',
+                    self.category_pages.get(info['full_path'], ''),
+                    len(info['children'])
+                )
+                for info in map(tree.__getitem__, sorted_paths)
             )
 
-            for category_path in sorted_paths:
-                category_info = tree[category_path]
-                page_id = self.category_pages.get(category_path, '')
-
-                writer.writerow([
-                    category_info['name'],
-                    category_info['full_path'],
-                    category_info['depth'],
-                    category_info['parent_path'] or '',
-                    page_id,
-                    len(category_info['children'])
-                ])
-
         logger.info(f"Exported {len(tree)} categories to CSV")
         return str(csv_path)
 
@@ -467,21 +742,26 @@ class CategoryOrganizer:
         """Get Notion page ID for a category path."""
         return self.category_pages.get(category_path)
 
-    def export_category_mapping(self, output_path: str):
+    def export_category_mapping(self, output_path: str, sort: bool = False):
         """
         Export simple category path to page ID mapping as CSV.
 
+        Rows follow creation order (parents before children) unless sort is set.
+
         Args:
             output_path: Path to output CSV file
+            sort: If True, order rows alphabetically by category path
         """
         logger.info(f"Exporting category mapping to {output_path}")
 
+        items = self.category_pages.items()
+        if sort:
+            items = sorted(items)
+
         with open(output_path, 'w', encoding='utf-8', newline='') as f:
             writer = csv.writer(f)
             writer.writerow(['category_path', 'page_id'])
-
-            for category_path, page_id in sorted(self.category_pages.items()):
-                writer.writerow([category_path, page_id])
+            writer.writerows(items)
 
         logger.info(f"Exported {len(self.category_pages)} category mappings")
 
@@ -491,7 +771,10 @@ def build_categories_from_csv(
     database_id: str,
     csv_path: str,
     dry_run: bool = False,
-    output_dir: str = "./migration_output"
+    output_dir: str = "./migration_output",
+    max_workers: int = 4,
+    rate_limit_delay: float = 0.1,
+    existing_mapping: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to build category hierarchy from CSV.
@@ -502,16 +785,21 @@ def build_categories_from_csv(
         csv_path: Path to article list CSV
         dry_run: If True, preview without creating pages
         output_dir: Directory to save output CSV files
+        max_workers: Number of concurrent workers for page creation
+        rate_limit_delay: Minimum delay between requests across all workers (seconds)
+        existing_mapping: Category mapping CSV from a previous run to reuse pages from
 
     Returns:
         Result dictionary from CategoryOrganizer.build_category_hierarchy()
     """
-    organizer = CategoryOrganizer(
+    with CategoryOrganizer(
         api_key=api_key,
         database_id=database_id,
         csv_path=csv_path,
         dry_run=dry_run,
-        output_dir=output_dir
-    )
-
-    return organizer.build_category_hierarchy()
+        output_dir=output_dir,
+        max_workers=max_workers,
+        rate_limit_delay=rate_limit_delay,
+        existing_mapping=existing_mapping
+    ) as organizer:
+        return organizer.build_category_hierarchy()
@@ -7,25 +7,36 @@ Usage:
     python -m post_processing get-imported-pages --parent-pages <id1>,<id2>
 """
 import logging
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
 import csv
 
 import requests
 
+from post_processing.http_session import create_session
+from post_processing.rate_limiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 
 class ImportedPageFetcher:
     """Fetch imported page IDs from Notion parent pages."""
 
-    def __init__(self, api_key: str):
+    # Pages buffered per parent between a fetch worker and the caller (one API page)
+    PAGE_QUEUE_SIZE = 100
+
+    def __init__(self, api_key: str, max_workers: int = 4, rate_limit_delay: float = 0.1):
         """
         Initialize imported page fetcher.
 
         Args:
             api_key: Notion integration API key
+            max_workers: Number of parent pages fetched concurrently
+            rate_limit_delay: Minimum delay between requests across all workers (seconds)
         """
         self.api_key = api_key
         self.base_url = "https://api.notion.com/v1"
@@ -34,28 +45,39 @@ class ImportedPageFetcher:
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28",
         }
+        # Keep-alive session so paginated requests reuse one connection
+        self.max_workers = max_workers
+        self.session = create_session(self.headers, pool_size=max_workers)
+        self.limiter = RateLimiter(rate_limit_delay)
         logger.info("Imported page fetcher initialized")
 
-    def get_children_pages(
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self.session.close()
+
+    def iter_children_pages(
         self,
         parent_page_id: str,
         filter_prefix: str = "KB"
-    ) -> List[Dict[str, str]]:
+    ) -> Iterator[Dict[str, str]]:
         """
-        Get children pages of a parent page, filtered by title prefix.
+        Yield children pages of a parent page, filtered by title prefix.
 
-        Uses pagination to retrieve all children pages.
+        Follows pagination lazily, so only one API page of children is held
+        at a time.
 
         Args:
             parent_page_id: Parent page ID to get children from
             filter_prefix: Only include pages whose title starts with this prefix
 
-        Returns:
-            List of dicts with 'page_id' and 'page_title' keys
+        Yields:
+            Dicts with 'page_id' and 'page_title' keys
+
+        Raises:
+            requests.exceptions.RequestException: If an API request fails
         """
         logger.info(f"Fetching children pages from parent: {parent_page_id}")
 
-        all_pages = []
         start_cursor = None
         has_more = True
         page_count = 0
@@ -69,9 +91,9 @@ class ImportedPageFetcher:
                 params["start_cursor"] = start_cursor
 
             # Get children blocks (which includes child pages)
-            response = requests.get(
+            self.limiter.acquire()
+            response = self.session.get(
                 f"{self.base_url}/blocks/{parent_page_id}/children",
-                headers=self.headers,
                 params=params
             )
             response.raise_for_status()
@@ -79,22 +101,14 @@ class ImportedPageFetcher:
             data = response.json()
             results = data.get("results", [])
 
-            # Filter for child_page blocks with KB prefix
-            for block in results:
-                if block.get("type") == "child_page":
-                    page_id = block.get("id")
-                    title = block.get("child_page", {}).get("title", "")
-
-                    # Check if title starts with prefix
-                    if title.startswith(filter_prefix):
-                        # Remove hyphens from page_id
-                        page_id_no_hyphens = page_id.replace("-", "")
-
-                        all_pages.append({
-                            "page_id": page_id_no_hyphens,
-                            "page_title": title
-                        })
-                        page_count += 1
+            # Filter for child_page blocks with KB prefix (page IDs without hyphens)
+            matched = [
+                {"page_id": block.get("id").replace("-", ""), "page_title": title}
+                for block in results
+                if block.get("type") == "child_page"
+                and (title := block.get("child_page", {}).get("title", "")).startswith(filter_prefix)
+            ]
+            page_count += len(matched)
 
             # Check pagination
             has_more = data.get("has_more", False)
@@ -106,52 +120,126 @@ class ImportedPageFetcher:
                 f"has_more: {has_more}"
             )
 
+            yield from matched
+
         logger.info(
-            f"Found {len(all_pages)} pages starting with '{filter_prefix}' "
+            f"Found {page_count} pages starting with '{filter_prefix}' "
             f"under parent {parent_page_id}"
         )
-        return all_pages
 
-    def get_imported_pages_from_multiple_parents(
+    def get_children_pages(
         self,
-        parent_page_ids: List[str],
+        parent_page_id: str,
         filter_prefix: str = "KB"
     ) -> List[Dict[str, str]]:
         """
-        Get children pages from multiple parent pages.
+        Get children pages of a parent page, filtered by title prefix.
+
+        Uses pagination to retrieve all children pages.
 
         Args:
-            parent_page_ids: List of parent page IDs
+            parent_page_id: Parent page ID to get children from
             filter_prefix: Only include pages whose title starts with this prefix
 
         Returns:
-            Combined list of all pages from all parents
+            List of dicts with 'page_id' and 'page_title' keys
+        """
+        return list(self.iter_children_pages(parent_page_id, filter_prefix))
+
+    def iter_imported_pages_from_multiple_parents(
+        self,
+        parent_page_ids: List[str],
+        filter_prefix: str = "KB"
+    ) -> Iterator[Dict[str, str]]:
         """
-        all_pages = []
+        Yield children pages from multiple parent pages, in parent order.
+
+        Parents are paginated concurrently. Each worker hands pages to the
+        caller through a small bounded queue per parent, so a worker that gets
+        ahead of the caller waits instead of buffering a whole parent; at most
+        max_workers * PAGE_QUEUE_SIZE pages are held at once.
+
+        Args:
+            parent_page_ids: List of parent page IDs
+            filter_prefix: Only include pages whose title starts with this prefix
 
-        for parent_id in parent_page_ids:
+        Yields:
+            Page dicts with 'page_id' and 'page_title' keys, in parent order
+        """
+        queues = [queue.Queue(maxsize=self.PAGE_QUEUE_SIZE) for _ in parent_page_ids]
+        stop = threading.Event()  # Set if the caller stops iterating early
+        done = object()  # End-of-parent marker
+
+        def put(page_queue: queue.Queue, item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    page_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch(parent_id: str, page_queue: queue.Queue) -> None:
             try:
-                pages = self.get_children_pages(parent_id, filter_prefix)
-                all_pages.extend(pages)
+                for page in self.iter_children_pages(parent_id, filter_prefix):
+                    if not put(page_queue, page):
+                        return
             except requests.exceptions.RequestException as e:
                 logger.error(f"Failed to fetch children from {parent_id}: {e}")
-                continue
+            finally:
+                put(page_queue, done)
+
+        total = 0
+
+        # Parents start in order, so the parent being read always has a running
+        # worker; later parents block on their full queues until it finishes
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for parent_id, page_queue in zip(parent_page_ids, queues):
+                executor.submit(fetch, parent_id, page_queue)
+
+            for page_queue in queues:
+                while (page := page_queue.get()) is not done:
+                    total += 1
+                    yield page
+        finally:
+            stop.set()
+            executor.shutdown(cancel_futures=True)
 
         logger.info(
-            f"Total pages found across {len(parent_page_ids)} parents: {len(all_pages)}"
+            f"Total pages found across {len(parent_page_ids)} parents: {total}"
         )
-        return all_pages
+
+    def get_imported_pages_from_multiple_parents(
+        self,
+        parent_page_ids: List[str],
+        filter_prefix: str = "KB"
+    ) -> List[Dict[str, str]]:
+        """
+        Get children pages from multiple parent pages.
+
+        Args:
+            parent_page_ids: List of parent page IDs
+            filter_prefix: Only include pages whose title starts with this prefix
+
+        Returns:
+            Combined list of all pages from all parents
+        """
+        return list(self.iter_imported_pages_from_multiple_parents(parent_page_ids, filter_prefix))
 
     def save_to_csv(
         self,
-        pages: List[Dict[str, str]],
+        pages: Iterable[Dict[str, str]],
         output_dir: Path
     ) -> Path:
         """
         Save page IDs to CSV file.
 
+        Pages are written as they are consumed, so a generator is never
+        materialized in memory.
+
         Args:
-            pages: List of page dicts with page_id and page_title
+            pages: Page dicts with page_id and page_title (list or iterator)
             output_dir: Directory to save the CSV file
 
         Returns:
@@ -169,9 +257,13 @@ class ImportedPageFetcher:
         with open(output_path, "w", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=["page_id", "page_title"])
             writer.writeheader()
-            writer.writerows(pages)
 
-        logger.info(f"Saved {len(pages)} page IDs to: {output_path}")
+            count = 0
+            for page in pages:
+                writer.writerow(page)
+                count += 1
+
+        logger.info(f"Saved {count} page IDs to: {output_path}")
         return output_path
 
 
@@ -193,7 +285,8 @@ def main(
     api_key: str,
     output_dir: Path,
     filter_prefix: str = "KB",
-    max_workers: int = 4
+    max_workers: int = 4,
+    rate_limit_delay: float = 0.1
 ) -> Path:
     """
     Main function to get imported page IDs.
@@ -203,7 +296,8 @@ def main(
         api_key: Notion API key
         output_dir: Directory to save output CSV
         filter_prefix: Only include pages starting with this prefix
-        max_workers: Number of concurrent workers (for future threading)
+        max_workers: Number of parent pages fetched concurrently
+        rate_limit_delay: Minimum delay between requests (seconds)
 
     Returns:
         Path to output CSV file
@@ -213,15 +307,20 @@ def main(
     logger.info(f"Processing {len(parent_ids)} parent page(s)")
 
     # Initialize fetcher
-    fetcher = ImportedPageFetcher(api_key=api_key)
-
-    # Get all pages
-    pages = fetcher.get_imported_pages_from_multiple_parents(
-        parent_page_ids=parent_ids,
-        filter_prefix=filter_prefix
+    fetcher = ImportedPageFetcher(
+        api_key=api_key,
+        max_workers=max_workers,
+        rate_limit_delay=rate_limit_delay
     )
 
-    # Save to CSV
-    output_path = fetcher.save_to_csv(pages, output_dir)
+    # Stream pages straight into the CSV as each parent is fetched
+    try:
+        pages = fetcher.iter_imported_pages_from_multiple_parents(
+            parent_page_ids=parent_ids,
+            filter_prefix=filter_prefix
+        )
+        output_path = fetcher.save_to_csv(pages, output_dir)
+    finally:
+        fetcher.close()
 
     return output_path
@@ -0,0 +1,28 @@
+"""Shared HTTP session setup for Notion API clients."""
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(headers: Dict[str, str], pool_size: int = 10) -> requests.Session:
+    """
+    Create a requests session that keeps connections to the Notion API alive.
+
+    Reusing one session avoids a new TCP/TLS handshake per request; the pool
+    should be at least as large as the number of threads sharing the session.
+
+    Args:
+        headers: Headers sent with every request (Authorization, Notion-Version, ...)
+        pool_size: Maximum number of pooled connections per host
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+
+    return session
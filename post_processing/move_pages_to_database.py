@@ -7,27 +7,68 @@ Usage:
     python -m post_processing move-pages --database <id> --pages-csv <file>
 """
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, TextIO
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import csv
+import json
+import random
 import time
 
 import requests
 
+from post_processing.http_session import create_session
+from post_processing.rate_limiter import AdaptiveRateLimiter
+
 logger = logging.getLogger(__name__)
 
+# Deletes hyphens from Notion IDs in a single translate() pass
+_HYPHEN_TABLE = str.maketrans("", "", "-")
+
+
+def _strip_hyphens(notion_id: str) -> str:
+    """
+    Remove hyphens from a Notion ID, returning IDs without hyphens unchanged.
+
+    Args:
+        notion_id: Notion ID with or without hyphens
+
+    Returns:
+        ID without hyphens
+    """
+    return notion_id.translate(_HYPHEN_TABLE) if "-" in notion_id else notion_id
+
 
 class PageMover:
     """Move pages to a target database using Notion's page move API."""
 
-    def __init__(self, api_key: str):
+    # Rate limited or transient server errors; other 4xx responses fail immediately
+    RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    # Typical latency of a move request (seconds), used to size the worker pool
+    AVG_REQUEST_LATENCY = 0.5
+    # Upper bound on worker threads; more only queue behind the rate limiter
+    MAX_WORKERS = 16
+
+    def __init__(
+        self,
+        api_key: str,
+        pool_size: int = 10,
+        rate_limit_delay: float = 0.1,
+        max_retries: int = 5,
+        backoff_cap: float = 30.0
+    ):
         """
         Initialize page mover.
 
         Args:
             api_key: Notion integration API key
+            pool_size: Pooled connections to keep open (at least the number of worker threads)
+            rate_limit_delay: Minimum delay between requests across all workers (seconds);
+                the limiter widens this while Notion is throttling
+            max_retries: Maximum move attempts per page for retryable errors
+            backoff_cap: Upper bound for the computed backoff delay (seconds)
         """
         self.api_key = api_key
         self.base_url = "https://api.notion.com/v1"
@@ -36,9 +77,44 @@ class PageMover:
             "Content-Type": "application/json",
             "Notion-Version": "2025-09-03",
         }
+        # One keep-alive session for all requests, shared by worker threads
+        self.session = create_session(self.headers, pool_size=pool_size)
+        # Spaces requests evenly across worker threads; slows down when Notion
+        # returns 429 and speeds back up to rate_limit_delay spacing on success
+        self.limiter = AdaptiveRateLimiter(rate_limit_delay)
+        self.rate_limit_delay = rate_limit_delay
+        self.max_retries = max_retries
+        self.backoff_cap = backoff_cap
         self._database_cache = {}
+        self._data_source_cache = {}
+        self._move_body_cache = {}  # data_source_id -> encoded move body
+        self._move_request_cache = {}  # data_source_id -> prepared move request template
+        self._send_settings = None
         logger.info("Page mover initialized")
 
+    @classmethod
+    def default_workers(cls, rate_limit_delay: float) -> int:
+        """
+        Size the worker pool to the request rate budget.
+
+        By Little's law, the requests in flight at the target rate are the rate
+        times the per-request latency; two extra workers absorb latency spikes.
+
+        Args:
+            rate_limit_delay: Minimum delay between requests (seconds)
+
+        Returns:
+            Number of worker threads, between 2 and MAX_WORKERS
+        """
+        if rate_limit_delay <= 0:
+            return cls.MAX_WORKERS
+        rate_per_sec = 1 / rate_limit_delay
+        return min(cls.MAX_WORKERS, max(2, int(rate_per_sec * cls.AVG_REQUEST_LATENCY) + 2))
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self.session.close()
+
     def get_database(self, database_id: str) -> Dict[str, Any]:
         """
         Get database information including data_source_id.
@@ -59,10 +135,7 @@ class PageMover:
 
         logger.info(f"Fetching database info: {database_id}")
 
-        response = requests.get(
-            f"{self.base_url}/databases/{database_id}",
-            headers=self.headers
-        )
+        response = self.session.get(f"{self.base_url}/databases/{database_id}")
         response.raise_for_status()
 
         database = response.json()
@@ -89,6 +162,10 @@ class PageMover:
         Raises:
             ValueError: If data_sources field is not in database response or is empty
         """
+        # Check cache first
+        if database_id in self._data_source_cache:
+            return self._data_source_cache[database_id]
+
         database = self.get_database(database_id)
 
         # Get data_source_id from data_sources array
@@ -108,14 +185,106 @@ class PageMover:
         # Get the first data source ID
         data_source_id = data_sources[0]["id"]
         # Remove hyphens if present
-        data_source_id = data_source_id.replace("-", "")
+        data_source_id = _strip_hyphens(data_source_id)
+        self._data_source_cache[database_id] = data_source_id
         logger.info(f"Got data_source_id from database response: {data_source_id}")
         return data_source_id
 
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying a failed move.
+
+        Uses the server's Retry-After header when present, otherwise exponential
+        backoff with full jitter so concurrent workers don't retry in lockstep.
+
+        Args:
+            response: Failed HTTP response
+            attempt: Zero-based number of the attempt that failed
+
+        Returns:
+            Delay in seconds
+        """
+        try:
+            return float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            return random.uniform(0, min(self.backoff_cap, 2 ** attempt))
+
+    def _move_body(self, data_source_id: str) -> bytes:
+        """
+        Get the encoded move request body, encoding it once per data source.
+
+        Every page moved into the same database sends the same body, so batch
+        runs serialize it once instead of once per page.
+
+        Args:
+            data_source_id: Database data_source_id (without hyphens)
+
+        Returns:
+            UTF-8 JSON request body
+        """
+        body = self._move_body_cache.get(data_source_id)
+        if body is None:
+            payload = {
+                "parent": {
+                    "type": "data_source_id",
+                    "data_source_id": data_source_id
+                }
+            }
+            body = json.dumps(payload).encode("utf-8")
+            self._move_body_cache[data_source_id] = body
+        return body
+
+    def _prepare_move_request(self, page_id: str, data_source_id: str) -> requests.PreparedRequest:
+        """
+        Build the move request for a page from a per-data-source template.
+
+        Session headers and the body are merged into a PreparedRequest once;
+        each page only copies the template and swaps in its URL.
+
+        Args:
+            page_id: Page ID to move (without hyphens)
+            data_source_id: Database data_source_id (without hyphens)
+
+        Returns:
+            PreparedRequest ready for session.send()
+        """
+        template = self._move_request_cache.get(data_source_id)
+        if template is None:
+            template = self.session.prepare_request(requests.Request(
+                "POST",
+                f"{self.base_url}/pages/PLACEHOLDER/move",
+                data=self._move_body(data_source_id)
+            ))
+            self._move_request_cache[data_source_id] = template
+
+        request = template.copy()
+        request.url = f"{self.base_url}/pages/{page_id}/move"
+        return request
+
+    def _send(self, request: requests.PreparedRequest) -> requests.Response:
+        """
+        Send a prepared request with the environment settings session.request() would apply.
+
+        Proxy and CA bundle settings are resolved once, since every request
+        goes to the same host.
+
+        Args:
+            request: Prepared request to send
+
+        Returns:
+            HTTP response
+        """
+        if self._send_settings is None:
+            self._send_settings = self.session.merge_environment_settings(
+                request.url, {}, None, None, None
+            )
+        return self.session.send(request, **self._send_settings)
+
     def move_page_to_database(
         self,
         page_id: str,
-        data_source_id: str
+        data_source_id: str,
+        parse_response: bool = True
     ) -> Dict[str, Any]:
         """
         Move a page to a database.
@@ -123,54 +292,74 @@ class PageMover:
         Args:
             page_id: Page ID to move (can be with or without hyphens)
             data_source_id: Database data_source_id (can be with or without hyphens)
+            parse_response: Parse and return the moved page object on success;
+                batch moves skip this since only success/page_id are used
 
         Returns:
             Dict with keys:
                 - success: bool
                 - page_id: str
                 - error: str (if success=False)
-                - response: dict (if success=True)
+                - status_code: int (if the API returned an error response)
+                - response: dict (if success=True and parse_response=True)
         """
         # Remove hyphens from IDs if present
-        page_id_clean = page_id.replace("-", "")
-        data_source_id_clean = data_source_id.replace("-", "")
+        page_id_clean = _strip_hyphens(page_id)
+        data_source_id_clean = _strip_hyphens(data_source_id)
 
         logger.info(f"Moving page {page_id_clean} to database {data_source_id_clean}")
 
         try:
-            # Build request body
-            body = {
-                "parent": {
-                    "type": "data_source_id",
-                    "data_source_id": data_source_id_clean
-                }
-            }
-
-            # Call move API
-            response = requests.post(
-                f"{self.base_url}/pages/{page_id_clean}/move",
-                headers=self.headers,
-                json=body
-            )
-
-            # Check for errors
+            request = self._prepare_move_request(page_id_clean, data_source_id_clean)
+
+            # Call move API, retrying rate limits and transient server errors
+            for attempt in range(self.max_retries):
+                self.limiter.acquire()
+                response = self._send(request)
+
+                if response.status_code == 429:
+                    self.limiter.on_throttle()
+                    logger.info(f"Rate limited by Notion, pacing at {self.limiter.current_rate:.1f} req/s")
+                elif response.status_code == 200:
+                    self.limiter.on_success()
+
+                if (
+                    response.status_code not in self.RETRYABLE_STATUS_CODES
+                    or attempt == self.max_retries - 1
+                ):
+                    break
+
+                delay = self._retry_delay(response, attempt)
+                logger.warning(
+                    f"HTTP {response.status_code} moving page {page_id_clean}, retrying in "
+                    f"{delay:.1f}s (attempt {attempt + 2}/{self.max_retries})"
+                )
+                time.sleep(delay)
+
+            # Check for errors. Non-retryable 4xx responses (bad ID, missing
+            # access, ...) reach here after a single attempt.
             if response.status_code != 200:
                 try:
                     error_data = response.json()
                     error_msg = error_data.get("message", f"HTTP {response.status_code}")
-                except Exception:
+                except ValueError:
                     error_msg = f"HTTP {response.status_code}: {response.text}"
                 logger.error(f"Failed to move page {page_id_clean}: {error_msg}")
                 return {
                     "success": False,
                     "page_id": page_id_clean,
-                    "error": error_msg
+                    "error": error_msg,
+                    "status_code": response.status_code
                 }
 
             # Success
+            if not parse_response:
+                logger.info(f"✅ Successfully moved page {page_id_clean}")
+                return {"success": True, "page_id": page_id_clean}
+
             try:
                 result = response.json()
-            except Exception as e:
+            except ValueError as e:
                 error_msg = f"Failed to parse success response: {str(e)}"
                 logger.error(f"Failed to move page {page_id_clean}: {error_msg}")
                 return {
@@ -194,118 +383,264 @@ class PageMover:
                 "page_id": page_id_clean,
                 "error": error_msg
             }
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            logger.error(f"Unexpected error moving page {page_id_clean}: {error_msg}")
-            return {
-                "success": False,
-                "page_id": page_id_clean,
-                "error": error_msg
-            }
 
-    def move_pages_batch(
+    def iter_move_results(
         self,
-        page_ids: List[str],
+        page_ids: Iterable[str],
         data_source_id: str,
-        max_workers: int = 4,
-        rate_limit_delay: float = 0.1
-    ) -> List[Dict[str, Any]]:
+        max_workers: Optional[int] = None,
+        rate_limit_delay: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Move multiple pages to database with threading.
+        Move multiple pages to database with threading, yielding each result as it completes.
+
+        Requests are paced by the mover's rate limiter, shared by all workers.
+        Page IDs are consumed lazily, so an iterator over a large CSV is never
+        fully materialized.
 
         Args:
-            page_ids: List of page IDs to move
+            page_ids: Page IDs to move (list or iterator)
             data_source_id: Target database data_source_id
-            max_workers: Maximum concurrent workers
-            rate_limit_delay: Delay between requests (seconds)
+            max_workers: Maximum concurrent workers; defaults to a pool sized
+                to the rate limit (see default_workers), capped at MAX_WORKERS
+            rate_limit_delay: Minimum delay between requests (seconds); replaces
+                the mover's pacing for this and later batches (default: keep it)
 
-        Returns:
-            List of result dicts from move_page_to_database
+        Yields:
+            Result dicts from move_page_to_database, in completion order
         """
-        logger.info(f"Moving {len(page_ids)} pages with {max_workers} workers")
+        if rate_limit_delay is not None and rate_limit_delay != self.rate_limit_delay:
+            self.rate_limit_delay = rate_limit_delay
+            self.limiter = AdaptiveRateLimiter(rate_limit_delay)
+
+        if max_workers is None:
+            max_workers = self.default_workers(self.rate_limit_delay)
+        elif max_workers > self.MAX_WORKERS:
+            logger.warning(
+                f"Capping workers at {self.MAX_WORKERS}; more would only queue behind the rate limiter"
+            )
+            max_workers = self.MAX_WORKERS
 
-        results = []
+        logger.info(f"Moving pages with {max_workers} workers")
+
+        # Constant for the whole batch, so strip hyphens once up front
+        data_source_id = _strip_hyphens(data_source_id)
+
+        # Only a window of max_workers * 4 futures is in flight; each
+        # completion submits the next page. max_workers=1 runs them one at a time.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending_pages = iter(page_ids)
+            future_to_page = {}
 
-        if max_workers == 1:
-            # Sequential processing
-            for page_id in page_ids:
-                result = self.move_page_to_database(page_id, data_source_id)
-                results.append(result)
-                time.sleep(rate_limit_delay)
-        else:
-            # Parallel processing
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all tasks
-                future_to_page = {
-                    executor.submit(
+            def submit_next() -> None:
+                page_id = next(pending_pages, None)
+                if page_id is not None:
+                    future = executor.submit(
                         self.move_page_to_database,
                         page_id,
-                        data_source_id
-                    ): page_id
-                    for page_id in page_ids
-                }
+                        data_source_id,
+                        parse_response=False
+                    )
+                    future_to_page[future] = page_id
+
+            for _ in range(max_workers * 4):
+                submit_next()
 
-                # Collect results as they complete
-                for future in as_completed(future_to_page):
-                    page_id = future_to_page[future]
+            # Collect results as they complete
+            while future_to_page:
+                done, _ = wait(future_to_page, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    page_id = future_to_page.pop(future)
                     try:
                         result = future.result()
-                        results.append(result)
                     except Exception as e:
                         logger.error(f"Exception moving page {page_id}: {e}")
-                        results.append({
+                        result = {
                             "success": False,
                             "page_id": page_id,
                             "error": str(e)
-                        })
+                        }
+
+                    yield result
+                    submit_next()
+
+    def move_pages_batch(
+        self,
+        page_ids: Iterable[str],
+        data_source_id: str,
+        max_workers: Optional[int] = None,
+        rate_limit_delay: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Move multiple pages to database with threading.
+
+        Args:
+            page_ids: Page IDs to move (list or iterator)
+            data_source_id: Target database data_source_id
+            max_workers: Maximum concurrent workers (see iter_move_results)
+            rate_limit_delay: Minimum delay between requests (seconds), or None
+                to keep the mover's pacing
+
+        Returns:
+            List of result dicts from move_page_to_database
+        """
+        results = []
+        success_count = 0
 
-                    # Rate limiting
-                    time.sleep(rate_limit_delay)
+        for result in self.iter_move_results(page_ids, data_source_id, max_workers, rate_limit_delay):
+            results.append(result)
+            success_count += result["success"]
 
         # Log summary
-        success_count = sum(1 for r in results if r["success"])
         fail_count = len(results) - success_count
-        logger.info(f"Move complete: {success_count} success, {fail_count} failed")
+        logger.info(
+            f"Move complete: {len(results)} pages, {success_count} success, {fail_count} failed"
+        )
 
         return results
 
+    def move_pages_to_log(
+        self,
+        page_ids: Iterable[str],
+        data_source_id: str,
+        results_path: Path,
+        max_workers: Optional[int] = None,
+        rate_limit_delay: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Move multiple pages to database, streaming results to an NDJSON log.
+
+        Each result is appended to results_path as one JSON object per line as
+        soon as it completes. Only counts and failed page IDs are kept in
+        memory, so memory stays flat regardless of batch size.
 
-def read_page_ids_from_csv(csv_path: Path) -> List[str]:
+        Args:
+            page_ids: Page IDs to move (list or iterator)
+            data_source_id: Target database data_source_id
+            results_path: NDJSON file to append results to
+            max_workers: Maximum concurrent workers (see iter_move_results)
+            rate_limit_delay: Minimum delay between requests (seconds), or None
+                to keep the mover's pacing
+
+        Returns:
+            Dict with keys:
+                - total: int
+                - success: int
+                - failed: int
+                - failed_page_ids: list of str
+                - results_path: Path
+        """
+        summary = {
+            "total": 0,
+            "success": 0,
+            "failed": 0,
+            "failed_page_ids": [],
+            "results_path": results_path,
+        }
+
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(results_path, "a", encoding="utf-8", buffering=1 << 20) as f:
+            results = self.iter_move_results(page_ids, data_source_id, max_workers, rate_limit_delay)
+            for result in results:
+                f.write(json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n")
+                summary["total"] += 1
+                if result["success"]:
+                    summary["success"] += 1
+                else:
+                    summary["failed"] += 1
+                    summary["failed_page_ids"].append(result["page_id"])
+
+        logger.info(f"Results streamed to: {results_path}")
+        logger.info(
+            f"Move complete: {summary['total']} pages, {summary['success']} success, "
+            f"{summary['failed']} failed"
+        )
+
+        return summary
+
+
+def iter_page_ids_from_csv(csv_path: Path) -> Iterator[str]:
     """
-    Read page IDs from CSV file.
+    Stream page IDs from CSV file.
+
+    The file is opened and its header checked right away, so a missing file
+    or column is raised by this call rather than on first iteration. Rows are
+    then read through a 1 MiB buffer as the iterator is consumed, so large
+    CSVs are never held in memory.
 
     Args:
         csv_path: Path to CSV file with 'page_id' column
 
     Returns:
-        List of page IDs
+        Iterator over non-empty page IDs without hyphens, in file order
 
     Raises:
+        FileNotFoundError: If the CSV file doesn't exist
         ValueError: If CSV doesn't have 'page_id' column
     """
     logger.info(f"Reading page IDs from: {csv_path}")
 
-    page_ids = []
-
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    f = open(csv_path, "r", encoding="utf-8", newline="", buffering=1 << 20)
+    try:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
 
         # Check for page_id column
-        if "page_id" not in reader.fieldnames:
-            raise ValueError(f"CSV must have 'page_id' column. Found: {reader.fieldnames}")
+        if "page_id" not in header:
+            raise ValueError(f"CSV must have 'page_id' column. Found: {header}")
+    except BaseException:
+        f.close()
+        raise
+
+    return _iter_page_id_rows(f, reader, header.index("page_id"))
 
+
+def _iter_page_id_rows(f: TextIO, reader: Iterator[List[str]], id_index: int) -> Iterator[str]:
+    """
+    Yield page IDs from the remaining rows of an open page CSV, closing it when done.
+
+    Args:
+        f: Open CSV file
+        reader: csv.reader over f, positioned after the header
+        id_index: Index of the 'page_id' column
+
+    Yields:
+        Non-empty page IDs without hyphens, in file order
+    """
+    count = 0
+
+    with f:
         for row in reader:
-            page_id = row.get("page_id", "").strip()
-            if page_id:
-                page_ids.append(page_id)
+            if len(row) > id_index:
+                page_id = _strip_hyphens(row[id_index].strip())
+                if page_id:
+                    count += 1
+                    yield page_id
 
-    logger.info(f"Read {len(page_ids)} page IDs from CSV")
-    return page_ids
+    logger.info(f"Read {count} page IDs from CSV")
+
+
+def read_page_ids_from_csv(csv_path: Path) -> List[str]:
+    """
+    Read page IDs from CSV file.
+
+    Args:
+        csv_path: Path to CSV file with 'page_id' column
+
+    Returns:
+        List of page IDs without hyphens
+
+    Raises:
+        ValueError: If CSV doesn't have 'page_id' column
+    """
+    return list(iter_page_ids_from_csv(csv_path))
 
 
 def write_results_log(
     results: List[Dict[str, Any]],
-    output_dir: Path
+    output_dir: Path,
+    success_count: Optional[int] = None
 ) -> Path:
     """
     Write move operation results to log file.
@@ -313,6 +648,8 @@ def write_results_log(
     Args:
         results: List of result dicts from move operations
         output_dir: Directory to save log file
+        success_count: Number of successful results, if already counted by the
+            caller; otherwise counted from results
 
     Returns:
         Path to log file
@@ -325,13 +662,21 @@ def write_results_log(
     log_filename = f"page_move_results_{timestamp}.log"
     log_path = output_dir / log_filename
 
-    # Write log
-    with open(log_path, "w", encoding="utf-8") as f:
+    def format_result(i: int, result: Dict[str, Any]) -> str:
+        page_id = result.get("page_id", "unknown")
+        if result.get("success", False):
+            return f"{i}. Page ID: {page_id}\n   Status: ✅ SUCCESS\n\n"
+        error = result.get("error", "Unknown error")
+        return f"{i}. Page ID: {page_id}\n   Status: ❌ FAILED\n   Error: {error}\n\n"
+
+    # Write log through a 1 MiB buffer, one string per result
+    with open(log_path, "w", encoding="utf-8", buffering=1 << 20) as f:
         f.write("=" * 80 + "\n")
         f.write(f"Page Move Results - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         f.write("=" * 80 + "\n\n")
 
-        success_count = sum(1 for r in results if r["success"])
+        if success_count is None:
+            success_count = sum(1 for r in results if r["success"])
         fail_count = len(results) - success_count
 
         f.write(f"Total pages: {len(results)}\n")
@@ -342,18 +687,7 @@ def write_results_log(
         f.write("Detailed Results\n")
         f.write("=" * 80 + "\n\n")
 
-        for i, result in enumerate(results, 1):
-            page_id = result.get("page_id", "unknown")
-            success = result.get("success", False)
-
-            f.write(f"{i}. Page ID: {page_id}\n")
-            if success:
-                f.write("   Status: ✅ SUCCESS\n")
-            else:
-                error = result.get("error", "Unknown error")
-                f.write(f"   Status: ❌ FAILED\n")
-                f.write(f"   Error: {error}\n")
-            f.write("\n")
+        f.writelines(format_result(i, result) for i, result in enumerate(results, 1))
 
     logger.info(f"Results log written to: {log_path}")
     return log_path
@@ -364,9 +698,9 @@ def main(
     pages_csv: Path,
     api_key: str,
     output_dir: Path,
-    max_workers: int = 4,
+    max_workers: Optional[int] = None,
     rate_limit_delay: float = 0.1
-) -> List[Dict[str, Any]]:
+) -> Dict[str, Any]:
     """
     Main function to move pages to database.
 
@@ -374,29 +708,38 @@ def main(
         target_database_id: Target database ID
         pages_csv: Path to CSV file with page_id column
         api_key: Notion API key
-        output_dir: Directory to save results log (unused, kept for compatibility)
-        max_workers: Number of concurrent workers
+        output_dir: Directory to save the NDJSON results log
+        max_workers: Number of concurrent workers; derived from rate_limit_delay if None
         rate_limit_delay: Delay between requests (seconds)
 
     Returns:
-        List of result dicts from move operations
+        Summary dict from PageMover.move_pages_to_log (counts, failed page IDs,
+        NDJSON results path)
     """
-    # Initialize mover
-    mover = PageMover(api_key=api_key)
+    if max_workers is None:
+        max_workers = PageMover.default_workers(rate_limit_delay)
 
-    # Get data_source_id from database_id
-    logger.info(f"Getting data_source_id for database: {target_database_id}")
-    data_source_id = mover.get_data_source_id(target_database_id)
-
-    # Read page IDs from CSV
-    page_ids = read_page_ids_from_csv(pages_csv)
-
-    # Move pages
-    results = mover.move_pages_batch(
-        page_ids=page_ids,
-        data_source_id=data_source_id,
-        max_workers=max_workers,
-        rate_limit_delay=rate_limit_delay
-    )
+    # Initialize mover
+    mover = PageMover(api_key=api_key, pool_size=max_workers, rate_limit_delay=rate_limit_delay)
+
+    try:
+        # Get data_source_id from database_id
+        logger.info(f"Getting data_source_id for database: {target_database_id}")
+        data_source_id = mover.get_data_source_id(target_database_id)
+
+        # Stream page IDs from CSV; the batch pulls them as workers free up.
+        # The header is checked here, before the results log and workers exist.
+        page_ids = iter_page_ids_from_csv(pages_csv)
+
+        # Move pages, streaming each result to an NDJSON log as it completes
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        summary = mover.move_pages_to_log(
+            page_ids=page_ids,
+            data_source_id=data_source_id,
+            results_path=output_dir / f"page_move_results_{timestamp}.jsonl",
+            max_workers=max_workers
+        )
+    finally:
+        mover.close()
 
-    return results
+    return summary
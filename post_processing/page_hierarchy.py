@@ -1,9 +1,12 @@
 """Manage page hierarchy in Notion - create parent-child (sub-item) relationships between database pages."""
+import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 import requests
 
+from post_processing.http_session import create_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,12 +17,16 @@ class NotionPageHierarchy:
     Notion auto-creates a self-relation with "Parent item" and "Sub-items" properties.
     """
 
-    def __init__(self, api_key: str):
+    # Notion rejects relation updates with more related pages than this
+    MAX_RELATIONS_PER_UPDATE = 100
+
+    def __init__(self, api_key: str, pool_size: int = 10):
         """
         Initialize Notion page hierarchy manager.
 
         Args:
             api_key: Notion integration API key
+            pool_size: Pooled connections to keep open (at least the number of worker threads)
 
         Example:
             hierarchy = NotionPageHierarchy(api_key="secret_xxx")
@@ -35,9 +42,16 @@ class NotionPageHierarchy:
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28",
         }
+        # One keep-alive session for all requests, shared by worker threads
+        self.session = create_session(self.headers, pool_size=pool_size)
         self._database_cache = {}  # Cache database schemas
+        self._relation_body_cache = {}  # (property ID, parent ID) -> encoded PATCH body
         logger.info("Notion page hierarchy manager initialized")
 
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self.session.close()
+
     def get_page(self, page_id: str) -> Dict[str, Any]:
         """
         Get page information from Notion.
@@ -53,10 +67,7 @@ class NotionPageHierarchy:
         """
         logger.info(f"Fetching page info: {page_id}")
 
-        response = requests.get(
-            f"{self.base_url}/pages/{page_id}",
-            headers=self.headers
-        )
+        response = self.session.get(f"{self.base_url}/pages/{page_id}")
         response.raise_for_status()
 
         page = response.json()
@@ -83,10 +94,7 @@ class NotionPageHierarchy:
 
         logger.info(f"Fetching database schema: {database_id}")
 
-        response = requests.get(
-            f"{self.base_url}/databases/{database_id}",
-            headers=self.headers
-        )
+        response = self.session.get(f"{self.base_url}/databases/{database_id}")
         response.raise_for_status()
 
         database = response.json()
@@ -147,6 +155,34 @@ class NotionPageHierarchy:
             logger.error(f"Error finding parent item property: {e}")
             return None
 
+    def find_subitems_property(self, database_id: str) -> Optional[str]:
+        """
+        Find the "Sub-items" relation property ID in a database.
+
+        This is the dual of the "Parent item" property: setting it on a parent page
+        updates the "Parent item" of every listed child in a single request.
+
+        Args:
+            database_id: Notion database ID
+
+        Returns:
+            Property ID of the "Sub-items" relation, or None if not found
+        """
+        parent_property_id = self.find_parent_item_property(database_id)
+        if not parent_property_id:
+            return None
+
+        try:
+            database = self.get_database(database_id)
+            for prop_config in database.get("properties", {}).values():
+                if prop_config.get("id") == parent_property_id:
+                    dual_property = prop_config.get("relation", {}).get("dual_property", {})
+                    return dual_property.get("synced_property_id")
+        except Exception as e:
+            logger.error(f"Error finding sub-items property: {e}")
+
+        return None
+
     def make_subitem(
         self,
         child_page_id: str,
@@ -287,9 +323,8 @@ class NotionPageHierarchy:
 
             logger.debug(f"Update payload: {update_payload}")
 
-            response = requests.patch(
+            response = self.session.patch(
                 f"{self.base_url}/pages/{child_page_id}",
-                headers=self.headers,
                 json=update_payload
             )
             response.raise_for_status()
@@ -369,6 +404,8 @@ class NotionPageHierarchy:
             "parent_page_id": parent_page_id,
             "parent_property_id": parent_property_id,
             "error": None,
+            "status_code": None,
+            "retry_after": None,
         }
 
         try:
@@ -383,35 +420,152 @@ class NotionPageHierarchy:
                 result["parent_title"] = self._extract_page_title(parent_page)
 
             # Update child page's "Parent item" relation property
+            response = self.session.patch(
+                f"{self.base_url}/pages/{child_page_id}",
+                data=self._parent_relation_body(parent_property_id, parent_page_id)
+            )
+            response.raise_for_status()
+
+            result["success"] = True
+            logger.debug(f"✅ Sub-item relationship created")
+
+            return result
+
+        except requests.exceptions.RequestException as e:
+            result["error"] = f"Failed to update page relation: {e}"
+            logger.error(result["error"])
+
+            if hasattr(e, "response") and e.response is not None:
+                self._record_http_error(result, e.response)
+                try:
+                    error_detail = e.response.json()
+                    result["error"] += f" - {error_detail.get('message', '')}"
+                except Exception:
+                    result["error"] += f" - {e.response.text}"
+
+            return result
+
+        except Exception as e:
+            result["error"] = f"Unexpected error: {e}"
+            logger.error(result["error"], exc_info=True)
+            return result
+
+    def get_relation_ids(self, page_id: str, property_id: str) -> List[str]:
+        """
+        Get all page IDs in a page's relation property.
+
+        Args:
+            page_id: Notion page ID
+            property_id: Relation property ID
+
+        Returns:
+            Related page IDs (all result pages are followed)
+
+        Raises:
+            requests.exceptions.RequestException: If API request fails
+        """
+        relation_ids = []
+        params = {}
+
+        while True:
+            response = self.session.get(
+                f"{self.base_url}/pages/{page_id}/properties/{property_id}",
+                params=params
+            )
+            response.raise_for_status()
+
+            data = response.json()
+            for item in data.get("results", []):
+                relation_ids.append(item["relation"]["id"])
+
+            if not data.get("has_more"):
+                return relation_ids
+            params = {"start_cursor": data.get("next_cursor")}
+
+    def make_subitems_bulk(
+        self,
+        parent_page_id: str,
+        child_page_ids: List[str],
+        subitems_property_id: str
+    ) -> Dict[str, Any]:
+        """
+        Make several pages sub-items of one parent with a single PATCH.
+
+        The parent's "Sub-items" relation is replaced, so existing sub-items are
+        fetched first and kept. Notion accepts at most MAX_RELATIONS_PER_UPDATE
+        related pages per request; larger groups are rejected so the caller can
+        fall back to make_subitem_optimized per child. Oversized input is
+        rejected before any API call.
+
+        Unlike make_subitem_optimized, which overwrites each child's "Parent
+        item", this only adds the children to the parent's "Sub-items": a child
+        that already has a different parent keeps it as well.
+
+        Args:
+            parent_page_id: Page ID that will be the new parent
+            child_page_ids: Page IDs to become sub-items
+            subitems_property_id: Pre-fetched "Sub-items" property ID (see find_subitems_property)
+
+        Returns:
+            Result dictionary with success status
+        """
+        result = {
+            "success": False,
+            "parent_page_id": parent_page_id,
+            "child_page_ids": child_page_ids,
+            "error": None,
+            "status_code": None,
+            "retry_after": None,
+        }
+
+        try:
+            logger.debug(f"Making {len(child_page_ids)} pages sub-items of {parent_page_id} (bulk)")
+
+            # Skip the relation read when the children alone cannot fit
+            unique_child_count = len(set(child_page_ids))
+            if unique_child_count > self.MAX_RELATIONS_PER_UPDATE:
+                result["error"] = (
+                    f"{unique_child_count} sub-items requested; "
+                    f"bulk update supports at most {self.MAX_RELATIONS_PER_UPDATE}"
+                )
+                return result
+
+            existing_ids = self.get_relation_ids(parent_page_id, subitems_property_id)
+            # Keep order, drop children that are already linked
+            relation_ids = list(dict.fromkeys(existing_ids + child_page_ids))
+
+            if len(relation_ids) > self.MAX_RELATIONS_PER_UPDATE:
+                result["error"] = (
+                    f"Parent would have {len(relation_ids)} sub-items; "
+                    f"bulk update supports at most {self.MAX_RELATIONS_PER_UPDATE}"
+                )
+                return result
+
             update_payload = {
                 "properties": {
-                    parent_property_id: {
-                        "relation": [
-                            {
-                                "id": parent_page_id
-                            }
-                        ]
+                    subitems_property_id: {
+                        "relation": [{"id": page_id} for page_id in relation_ids]
                     }
                 }
             }
 
-            response = requests.patch(
-                f"{self.base_url}/pages/{child_page_id}",
-                headers=self.headers,
+            response = self.session.patch(
+                f"{self.base_url}/pages/{parent_page_id}",
                 json=update_payload
             )
             response.raise_for_status()
 
             result["success"] = True
-            logger.debug(f"✅ Sub-item relationship created")
+            logger.debug(f"✅ {len(child_page_ids)} sub-item relationships created")
 
             return result
 
         except requests.exceptions.RequestException as e:
-            result["error"] = f"Failed to update page relation: {e}"
+            result["error"] = f"Failed to update sub-items relation: {e}"
             logger.error(result["error"])
 
             if hasattr(e, "response") and e.response is not None:
+                self._record_http_error(result, e.response)
                 try:
                     error_detail = e.response.json()
                     result["error"] += f" - {error_detail.get('message', '')}"
@@ -425,6 +579,53 @@ class NotionPageHierarchy:
             logger.error(result["error"], exc_info=True)
             return result
 
+    def _parent_relation_body(self, parent_property_id: str, parent_page_id: str) -> bytes:
+        """
+        Get the encoded "Parent item" update body, encoding it once per parent.
+
+        Every child moved under the same parent sends the same body, so bulk
+        runs serialize it once per category instead of once per page.
+
+        Args:
+            parent_property_id: "Parent item" property ID
+            parent_page_id: Parent page ID
+
+        Returns:
+            UTF-8 JSON request body
+        """
+        key = (parent_property_id, parent_page_id)
+        body = self._relation_body_cache.get(key)
+        if body is None:
+            update_payload = {
+                "properties": {
+                    parent_property_id: {
+                        "relation": [
+                            {
+                                "id": parent_page_id
+                            }
+                        ]
+                    }
+                }
+            }
+            body = json.dumps(update_payload).encode("utf-8")
+            self._relation_body_cache[key] = body
+        return body
+
+    @staticmethod
+    def _record_http_error(result: Dict[str, Any], response: requests.Response) -> None:
+        """
+        Store the status code and Retry-After delay of a failed response in a result dict.
+
+        Args:
+            result: Result dictionary to update
+            response: Failed HTTP response
+        """
+        result["status_code"] = response.status_code
+        try:
+            result["retry_after"] = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            result["retry_after"] = None
+
     def _extract_page_title(self, page: Dict[str, Any]) -> str:
         """
         Extract title from a Notion page object.
@@ -0,0 +1,89 @@
+"""Thread-safe client-side rate limiting for Notion API calls."""
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Space calls at least min_interval seconds apart across all threads.
+
+    Each acquire() reserves the next free slot under a lock and sleeps
+    outside it, so waiting threads don't block each other's reservations.
+    """
+
+    def __init__(self, min_interval: float):
+        """
+        Initialize rate limiter.
+
+        Args:
+            min_interval: Minimum seconds between calls (<= 0 disables limiting)
+        """
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def acquire(self) -> None:
+        """Block until the caller may issue its next request."""
+        if self.min_interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + self.min_interval
+
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Rate limiter that backs off when the server throttles and recovers on success.
+
+    Follows AIMD (additive increase, multiplicative decrease): each throttled
+    response halves the request rate, each success adds a small step back, up
+    to the rate allowed by the configured minimum interval. This settles on the
+    share of Notion's rate limit that is actually available, e.g. when other
+    integrations use the same workspace.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float = 2.0,
+        rate_step: float = 0.05
+    ):
+        """
+        Initialize adaptive rate limiter.
+
+        Args:
+            min_interval: Smallest spacing between calls, i.e. the fastest allowed rate (seconds)
+            max_interval: Largest spacing the limiter backs off to (seconds)
+            rate_step: Requests per second added back after each successful call
+        """
+        super().__init__(min_interval)
+        self.base_interval = max(min_interval, 0.0)
+        self.max_interval = max_interval
+        self.rate_step = rate_step
+
+    @property
+    def current_rate(self) -> float:
+        """Current allowed requests per second (inf when unlimited)."""
+        interval = self.min_interval
+        return 1.0 / interval if interval > 0 else float("inf")
+
+    def on_success(self) -> None:
+        """Additively raise the rate after a successful call."""
+        with self._lock:
+            interval = self.min_interval
+            if interval <= self.base_interval:
+                return
+            self.min_interval = max(self.base_interval, 1.0 / (1.0 / interval + self.rate_step))
+
+    def on_throttle(self) -> None:
+        """Halve the rate after a throttled (HTTP 429) call."""
+        with self._lock:
+            # Start from a small spacing when currently unlimited
+            interval = self.min_interval if self.min_interval > 0 else self.max_interval / 64
+            self.min_interval = min(self.max_interval, interval * 2)
@@ -12,8 +12,10 @@ This is equivalent to running:
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path (once, so re-imports don't grow sys.path)
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from cli_utils import CommonCLI, create_base_parser
 from config import Config, ConfigurationError
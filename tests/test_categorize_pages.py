@@ -0,0 +1,87 @@
+"""Check which Notion update PageCategorizer uses, with the hierarchy API stubbed out."""
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from post_processing import categorize_pages
+from post_processing.categorize_pages import PageCategorizer
+from post_processing.page_hierarchy import NotionPageHierarchy
+
+
+class FakeHierarchy:
+    """Records calls instead of sending them to Notion."""
+
+    MAX_RELATIONS_PER_UPDATE = NotionPageHierarchy.MAX_RELATIONS_PER_UPDATE
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.single = []  # child page IDs linked one at a time
+        self.bulk = []  # (parent page ID, child page IDs) per bulk update
+
+    def find_parent_item_property(self, database_id):
+        return 'parent-prop'
+
+    def find_subitems_property(self, database_id):
+        return 'subitems-prop'
+
+    def make_subitem_optimized(self, child_page_id, parent_page_id, parent_property_id, verify=True):
+        with self.lock:
+            self.single.append(child_page_id)
+        return {"success": True, "error": None}
+
+    def make_subitems_bulk(self, parent_page_id, child_page_ids, subitems_property_id):
+        with self.lock:
+            self.bulk.append((parent_page_id, list(child_page_ids)))
+        return {"success": True, "error": None}
+
+    def close(self):
+        pass
+
+
+PAGES = [
+    {"page_id": "a1", "category_path": "A"},
+    {"page_id": "a2", "category_path": "A"},
+    {"page_id": "a3", "category_path": "A"},
+    {"page_id": "b1", "category_path": "B"},
+]
+CATEGORY_MAP = {"A": "cat-a", "B": "cat-b"}
+
+
+@pytest.fixture(autouse=True)
+def clear_property_cache():
+    """Property IDs are cached per process; start each test without them."""
+    categorize_pages._property_id_cache.clear()
+    yield
+    categorize_pages._property_id_cache.clear()
+
+
+def run_batch(**kwargs):
+    categorizer = PageCategorizer('test_key', max_workers=2, rate_limit_delay=0, **kwargs)
+    categorizer.hierarchy = FakeHierarchy()
+    results = categorizer.categorize_pages_batch(PAGES, CATEGORY_MAP, 'db')
+    return categorizer.hierarchy, results
+
+
+def test_per_page_updates_by_default():
+    """Without bulk, every page gets its own Parent item update, whatever its group size."""
+    hierarchy, results = run_batch()
+
+    assert hierarchy.bulk == []
+    assert sorted(hierarchy.single) == ["a1", "a2", "a3", "b1"]
+    assert [r["page_id"] for r in results] == ["a1", "a2", "a3", "b1"]
+    assert all(r["success"] for r in results)
+
+
+def test_bulk_groups_pages_by_category():
+    """With bulk, a multi-page category is linked in one update; single pages still go one by one."""
+    hierarchy, results = run_batch(bulk=True)
+
+    assert hierarchy.bulk == [("cat-a", ["a1", "a2", "a3"])]
+    assert hierarchy.single == ["b1"]
+    assert [r["page_id"] for r in results] == ["a1", "a2", "a3", "b1"]
+    assert all(r["success"] for r in results)
@@ -0,0 +1,68 @@
+"""Check batch page moves and the NDJSON results log with the Notion API stubbed out."""
+import sys
+import json
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from post_processing.move_pages_to_database import PageMover, iter_page_ids_from_csv
+
+
+def fake_move(page_id, data_source_id, parse_response=True):
+    """Pretend to move a page; IDs starting with 'bad' fail."""
+    if page_id.startswith('bad'):
+        return {"success": False, "page_id": page_id, "error": "rejected"}
+    return {"success": True, "page_id": page_id, "error": None}
+
+
+@pytest.fixture
+def mover(monkeypatch):
+    mover = PageMover('test_key', rate_limit_delay=0)
+    monkeypatch.setattr(mover, 'move_page_to_database', fake_move)
+    yield mover
+    mover.close()
+
+
+def test_move_pages_batch_returns_every_result(mover):
+    """move_pages_batch still returns one result per page."""
+    results = mover.move_pages_batch(['p1', 'bad2', 'p3'], 'ds-1', max_workers=2)
+
+    assert sorted(r["page_id"] for r in results) == ['bad2', 'p1', 'p3']
+    assert sum(r["success"] for r in results) == 2
+
+
+def test_move_pages_to_log_streams_results(mover, tmp_path):
+    """move_pages_to_log writes one JSON line per page and returns only the summary."""
+    results_path = tmp_path / 'logs' / 'move_results.jsonl'
+    page_ids = iter(['p1', 'bad2', 'p3', 'bad4'])
+
+    summary = mover.move_pages_to_log(page_ids, 'ds-1', results_path, max_workers=2)
+
+    assert summary["total"] == 4
+    assert summary["success"] == 2
+    assert summary["failed"] == 2
+    assert sorted(summary["failed_page_ids"]) == ['bad2', 'bad4']
+    assert summary["results_path"] == results_path
+
+    lines = results_path.read_text(encoding='utf-8').splitlines()
+    assert sorted(json.loads(line)["page_id"] for line in lines) == ['bad2', 'bad4', 'p1', 'p3']
+
+
+def test_iter_page_ids_from_csv_checks_header_eagerly(tmp_path):
+    """A CSV without a page_id column is rejected before iteration starts."""
+    csv_path = tmp_path / 'pages.csv'
+    csv_path.write_text('id,title\n1,x\n', encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        iter_page_ids_from_csv(csv_path)
+
+
+def test_iter_page_ids_from_csv_strips_hyphens(tmp_path):
+    """Page IDs are yielded without hyphens, skipping empty cells."""
+    csv_path = tmp_path / 'pages.csv'
+    csv_path.write_text('page_id,title\nab-cd,x\n,empty\nef,y\n', encoding='utf-8')
+
+    assert list(iter_page_ids_from_csv(csv_path)) == ['abcd', 'ef']
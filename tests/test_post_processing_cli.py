@@ -0,0 +1,82 @@
+"""Smoke tests for the post-processing CLI handlers with the Notion work stubbed out."""
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from cli_utils import CommonCLI
+from config import Config
+from post_processing import __main__ as cli
+from post_processing import categorize_pages, move_pages_to_database
+
+
+@pytest.fixture
+def notion_env(monkeypatch):
+    """Skip log file setup and Notion config validation for handler runs."""
+    monkeypatch.setattr(CommonCLI, 'setup_logging', staticmethod(lambda **kwargs: None))
+    monkeypatch.setattr(Config, 'validate_notion', classmethod(lambda cls: None))
+    monkeypatch.setattr(Config, 'NOTION_API_KEY', 'test_key', raising=False)
+
+
+def make_args(**kwargs):
+    """Build handler args with the shared verbosity flags."""
+    return argparse.Namespace(verbose=False, quiet=False, **kwargs)
+
+
+def test_cmd_categorize_pages(notion_env, monkeypatch, capsys):
+    """categorize-pages reports counts from the result list."""
+    results = [
+        {"page_id": "p1", "success": True},
+        {"page_id": "p2", "success": True},
+    ]
+    monkeypatch.setattr(categorize_pages, 'main', lambda **kwargs: results)
+
+    args = make_args(pl='pages.csv', cl='categories.csv', database='db',
+                     workers=2, rate_limit=None, bulk=False)
+    assert cli.cmd_categorize_pages(args) == 0
+
+    out = capsys.readouterr().out
+    assert "All pages categorized successfully" in out
+    assert "Total pages: 2" in out
+
+
+def test_cmd_categorize_pages_failures(notion_env, monkeypatch, capsys):
+    """categorize-pages exits non-zero when any page failed."""
+    results = [
+        {"page_id": "p1", "success": True},
+        {"page_id": "p2", "success": False},
+    ]
+    monkeypatch.setattr(categorize_pages, 'main', lambda **kwargs: results)
+
+    args = make_args(pl='pages.csv', cl='categories.csv', database='db',
+                     workers=2, rate_limit=None, bulk=False)
+    assert cli.cmd_categorize_pages(args) == 1
+
+    out = capsys.readouterr().out
+    assert "Error" not in out
+    assert "Failed: 1" in out
+
+
+def test_cmd_move_pages(notion_env, monkeypatch, capsys, tmp_path):
+    """move-pages reports counts and failed IDs from the summary dict."""
+    summary = {
+        "total": 3,
+        "success": 2,
+        "failed": 1,
+        "failed_page_ids": ["p3"],
+        "results_path": tmp_path / "move_results.jsonl",
+    }
+    monkeypatch.setattr(move_pages_to_database, 'main', lambda **kwargs: summary)
+
+    args = make_args(database='db', pages_csv='pages.csv', output_dir=str(tmp_path),
+                     workers=None, rate_limit=None)
+    assert cli.cmd_move_pages(args) == 1
+
+    out = capsys.readouterr().out
+    assert "Total pages: 3" in out
+    assert "Failed page IDs: p3" in out
+    assert "move_results.jsonl" in out
@@ -0,0 +1,58 @@
+"""Check that the streaming and in-memory empty list wrapper scans report the same chains."""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from page_checks.scan_empty_list_wrappers import EmptyListWrapperScanner
+
+
+CASES = {
+    'simple_chain': '<ul><li><ul><li><ul><li>x</li></ul></li></ul></li></ul>',
+    'comment_before_list': '<ul><li><!-- note --><ul><li><ul><li>x</li></ul></li></ul></li></ul>',
+    'pi_before_list': '<ul><li><?pi x?><ul><li><ul><li>x</li></ul></li></ul></li></ul>',
+    'styled_with_text': (
+        '<ol><li style="list-style-type: none">label<ol><li><ol><li>x</li></ol></li></ol></li></ol>'
+    ),
+    'text_breaks_chain': '<ul><li>text<ul><li><ul><li><ul><li>x</li></ul></li></ul></li></ul></li></ul>',
+    'siblings': (
+        '<ul><li><ul><li><ul><li>a</li></ul></li></ul></li>'
+        '<li><ul><li><ul><li><ul><li>b</li></ul></li></ul></li></ul></li></ul>'
+        '<p>between</p>'
+        '<ol><li><ol><li>c</li><li><ul><li><ul><li>d</li></ul></li></ul></li></ol></li></ol>'
+    ),
+    'no_wrappers': '<ul><li>a</li><li>b</li></ul>',
+}
+
+
+def comparable(rows):
+    """Drop line_number, which the streaming scan cannot recover."""
+    return [{k: v for k, v in row.items() if k != 'line_number'} for row in rows]
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_stream_matches_scan_html(name, tmp_path):
+    """scan_html_stream reports the same rows as scan_html."""
+    html = f'<html><body>{CASES[name]}</body></html>'
+    file_path = tmp_path / f'{name}.html'
+    file_path.write_text(html, encoding='utf-8')
+
+    scanner = EmptyListWrapperScanner()
+    expected = scanner.scan_html(html, file_path)
+    streamed = scanner.scan_html_stream(file_path)
+
+    assert comparable(streamed) == comparable(expected)
+
+
+def test_comment_before_list_is_reported(tmp_path):
+    """A comment ahead of the wrapped list does not hide the chain from the stream scan."""
+    html = f"<html><body>{CASES['comment_before_list']}</body></html>"
+    file_path = tmp_path / 'comment.html'
+    file_path.write_text(html, encoding='utf-8')
+
+    rows = EmptyListWrapperScanner().scan_html_stream(file_path)
+
+    assert [row['nesting_depth'] for row in rows] == [2]